@@ -16,7 +16,7 @@ from pathlib import Path
 # Add scripts directory to path for xls_parser import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
-from xls_parser import extract_xls_metadata, find_xls_documents
+from xls_parser import extract_xls_metadata, find_xls_documents, read_xls_preamble
 
 
 def run_gh_command(args: list[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -204,8 +204,8 @@ def main():
         for folder_name in added_folders:
             readme_path = root_dir / folder_name / "README.md"
             if readme_path.exists():
-                with open(readme_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                # Only the preamble is needed, so skip reading the body
+                content = read_xls_preamble(readme_path)
                 doc = extract_xls_metadata(content, folder_name)
                 if doc:
                     docs.append(doc)
@@ -0,0 +1,212 @@
+/*
+    Standards table behavior for the index and category pages
+
+    The builder renders only the first page of rows server-side. Sorting
+    and paging work on catalog.json (written by build_site.py), which is
+    fetched the first time the reader sorts or changes page, so the
+    initial HTML stays small however many standards there are.
+*/
+document.addEventListener("DOMContentLoaded", function () {
+  const table = document.getElementById("standardsTable");
+  const pager = document.getElementById("standardsPager");
+  if (!table || !pager) return;
+
+  const tbody = table.querySelector("tbody");
+  const headers = table.querySelectorAll("th.sortable");
+  const status = pager.querySelector(".pager-status");
+  const prevButton = pager.querySelector('[data-page="prev"]');
+  const nextButton = pager.querySelector('[data-page="next"]');
+  const baseUrl = pager.dataset.baseUrl;
+  const category = pager.dataset.category;
+  const pageSize = parseInt(pager.dataset.pageSize, 10);
+  const total = parseInt(pager.dataset.total, 10);
+
+  // Default sort: reverse numerical order (later standards more relevant)
+  let currentSort = { column: "number", direction: "desc" };
+  let currentPage = 0;
+  let catalogPromise = null;
+
+  // Set initial sort indicator on the Number column
+  const numberHeader = table.querySelector('th[data-column="number"]');
+  if (numberHeader) numberHeader.classList.add("sort-desc");
+
+  // Tooltip positioning functionality
+  document.querySelectorAll(".tooltip").forEach((tooltip) => {
+    const tooltipText = tooltip.querySelector(".tooltip-text");
+    if (!tooltipText) return;
+    tooltip.addEventListener("mouseenter", function () {
+      // Position the 300px wide tooltip 10px above the trigger, centered
+      // horizontally and kept within the viewport
+      const rect = tooltip.getBoundingClientRect();
+      const left = rect.left + rect.width / 2 - 150;
+      const top = rect.top - 10;
+      tooltipText.style.left =
+        Math.max(10, Math.min(left, window.innerWidth - 310)) + "px";
+      tooltipText.style.top = Math.max(10, top) + "px";
+    });
+    tooltip.addEventListener("mouseleave", function () {
+      // Reset positioning to hide tooltip properly
+      tooltipText.style.left = "";
+      tooltipText.style.top = "";
+    });
+  });
+
+  /**
+   * Load catalog.json once and return its documents as objects, limited
+   * to this page's category if it has one.
+   */
+  function loadDocuments() {
+    if (!catalogPromise) {
+      catalogPromise = fetch(pager.dataset.catalog)
+        .then((response) => {
+          if (!response.ok) throw new Error(`catalog: ${response.status}`);
+          return response.json();
+        })
+        .then((catalog) =>
+          catalog.documents
+            .map((row) =>
+              Object.fromEntries(
+                catalog.fields.map((field, i) => [field, row[i]]),
+              ),
+            )
+            .filter((doc) => !category || doc.category === category),
+        );
+    }
+    return catalogPromise;
+  }
+
+  function sortValue(doc, column) {
+    switch (column) {
+      case "number":
+        return parseInt(doc.number, 10);
+      case "author":
+        return doc.authors.map((author) => author[0].toLowerCase()).join(", ");
+      case "created":
+        // YYYY-MM-DD sorts correctly as a string
+        return doc.created;
+      default:
+        return String(doc[column]).toLowerCase();
+    }
+  }
+
+  function sortDocuments(documents) {
+    const { column, direction } = currentSort;
+    const sign = direction === "asc" ? 1 : -1;
+    return documents.slice().sort((a, b) => {
+      const aVal = sortValue(a, column);
+      const bVal = sortValue(b, column);
+      return aVal < bVal ? -sign : aVal > bVal ? sign : 0;
+    });
+  }
+
+  function cell(className, label, ...children) {
+    const td = document.createElement("td");
+    td.className = className;
+    td.dataset.label = label;
+    td.append(...children);
+    return td;
+  }
+
+  function link(href, text, className) {
+    const a = document.createElement("a");
+    a.href = href;
+    a.textContent = text;
+    if (className) a.className = className;
+    return a;
+  }
+
+  function badge(className, text) {
+    const span = document.createElement("span");
+    span.className = className;
+    span.textContent = text;
+    return span;
+  }
+
+  /** Build a table row with the same markup as the server-rendered rows. */
+  function renderRow(doc) {
+    const url = `${baseUrl}/xls/${doc.folder}.html`;
+    const statusName =
+      doc.status.charAt(0).toUpperCase() + doc.status.slice(1).toLowerCase();
+    const authors = [];
+    doc.authors.forEach(([name, href], i) => {
+      if (i) authors.push(", ");
+      authors.push(link(href, name));
+    });
+    const columns = {
+      number: () =>
+        cell(
+          "number-col",
+          "Number",
+          link(url, `XLS-${doc.number}`, "xls-link"),
+        ),
+      title: () => cell("title-col", "Title", link(url, doc.title)),
+      category: () =>
+        cell(
+          "category-col",
+          "Category",
+          badge(`category-badge ${doc.category.toLowerCase()}`, doc.category),
+        ),
+      author: () => cell("author-col", "Author", ...authors),
+      status: () =>
+        cell(
+          "status-col",
+          "Status",
+          badge(`status-badge ${doc.status.toLowerCase()}`, statusName),
+        ),
+      created: () => cell("created-col", "Created", doc.created),
+    };
+
+    const row = document.createElement("tr");
+    row.className = `status-${doc.status}`;
+    // Only emit the columns this table has (category pages omit Category)
+    headers.forEach((header) => row.append(columns[header.dataset.column]()));
+    return row;
+  }
+
+  function updatePager() {
+    const first = currentPage * pageSize;
+    const last = Math.min(first + pageSize, total);
+    status.textContent = `Showing ${first + 1}–${last} of ${total}`;
+    prevButton.disabled = currentPage === 0;
+    nextButton.disabled = last >= total;
+  }
+
+  async function showPage(page) {
+    try {
+      const documents = sortDocuments(await loadDocuments());
+      currentPage = page;
+      const rows = documents
+        .slice(page * pageSize, (page + 1) * pageSize)
+        .map(renderRow);
+      tbody.replaceChildren(...rows);
+      updatePager();
+    } catch (error) {
+      console.error("Could not load the standards catalog:", error);
+    }
+  }
+
+  // Add click event listeners to all sortable headers
+  headers.forEach((header) => {
+    header.addEventListener("click", function () {
+      const column = this.dataset.column;
+      // Toggle direction if clicking the same column
+      const direction =
+        currentSort.column === column && currentSort.direction === "asc"
+          ? "desc"
+          : "asc";
+      currentSort = { column, direction };
+
+      // Update visual sort indicators in column headers
+      headers.forEach((h) => h.classList.remove("sort-asc", "sort-desc"));
+      this.classList.add(`sort-${direction}`);
+
+      showPage(0);
+    });
+  });
+
+  prevButton.addEventListener("click", () => showPage(currentPage - 1));
+  nextButton.addEventListener("click", () => showPage(currentPage + 1));
+
+  pager.hidden = total <= pageSize;
+  updatePager();
+});
@@ -0,0 +1,144 @@
+/*
+    Client-side full-text search for the XLS Standards website
+
+    Queries the prebuilt index under search/ (see scripts/search_index.py):
+    - index.json maps document IDs (XLS numbers) to [url, title,
+      description] and lists the shards and tokenizer settings
+    - <prefix>.json holds the postings for terms starting with <prefix>
+    Only the shards for the words being typed are downloaded, and each
+    shard is fetched at most once per page load.
+*/
+(function () {
+  const input = document.getElementById("siteSearch");
+  const results = document.getElementById("siteSearchResults");
+  if (!input || !results) return;
+
+  const indexUrl = input.dataset.searchIndex;
+  const baseUrl = input.dataset.baseUrl;
+  const maxResults = 20;
+  const shardCache = new Map();
+  let indexPromise = null;
+  let latestQuery = 0;
+
+  function fetchJson(url) {
+    return fetch(url).then((response) => {
+      if (!response.ok) throw new Error(`${url}: ${response.status}`);
+      return response.json();
+    });
+  }
+
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetchJson(`${indexUrl}/index.json`).then((index) => {
+        index.shardSet = new Set(index.shards);
+        index.stopwordSet = new Set(index.stopwords);
+        return index;
+      });
+    }
+    return indexPromise;
+  }
+
+  function loadShard(index, prefix) {
+    if (!index.shardSet.has(prefix)) return Promise.resolve({});
+    if (!shardCache.has(prefix)) {
+      shardCache.set(prefix, fetchJson(`${indexUrl}/${prefix}.json`));
+    }
+    return shardCache.get(prefix);
+  }
+
+  // Same rules as tokenize() in scripts/search_index.py
+  function tokenize(index, text) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(
+      (term) =>
+        term.length >= index.min_term_length && !index.stopwordSet.has(term),
+    );
+  }
+
+  // Same order as Python string comparison, used to break score ties
+  function compareIds(a, b) {
+    return a < b ? -1 : a > b ? 1 : 0;
+  }
+
+  /**
+   * Rank documents matching every word; the last word also matches as a
+   * prefix so results update while it is being typed.
+   */
+  async function search(query) {
+    const index = await loadIndex();
+    const words = tokenize(index, query);
+    if (!words.length) return [];
+
+    const shards = await Promise.all(
+      words.map((word) => loadShard(index, word.slice(0, index.prefix_length))),
+    );
+
+    let totals = null;
+    words.forEach((word, position) => {
+      const isLast = position === words.length - 1;
+      const matches = new Map();
+      for (const [term, postings] of Object.entries(shards[position])) {
+        if (term !== word && !(isLast && term.startsWith(word))) continue;
+        for (const [docId, score] of postings) {
+          matches.set(docId, Math.max(matches.get(docId) || 0, score));
+        }
+      }
+      if (totals === null) {
+        totals = matches;
+      } else {
+        const combined = new Map();
+        for (const [docId, total] of totals) {
+          if (matches.has(docId)) {
+            combined.set(docId, total + matches.get(docId));
+          }
+        }
+        totals = combined;
+      }
+    });
+
+    return Array.from(totals)
+      .sort((a, b) => b[1] - a[1] || compareIds(a[0], b[0]))
+      .slice(0, maxResults)
+      .map(([docId]) => index.documents[docId]);
+  }
+
+  function showResults(documents, query) {
+    results.replaceChildren();
+    if (!query.trim()) {
+      results.hidden = true;
+      return;
+    }
+    if (!documents.length) {
+      const empty = document.createElement("li");
+      empty.className = "search-empty";
+      empty.textContent = "No matching standards.";
+      results.append(empty);
+    }
+    for (const [url, title, description] of documents) {
+      const item = document.createElement("li");
+      const link = document.createElement("a");
+      link.href = `${baseUrl}/${url}`;
+      link.textContent = title;
+      const summary = document.createElement("span");
+      summary.textContent = description;
+      item.append(link, summary);
+      results.append(item);
+    }
+    results.hidden = false;
+  }
+
+  let debounce = null;
+  input.addEventListener("input", function () {
+    clearTimeout(debounce);
+    debounce = setTimeout(async () => {
+      const query = input.value;
+      const queryId = ++latestQuery;
+      try {
+        const documents = await search(query);
+        // Ignore responses to queries that have since been replaced
+        if (queryId === latestQuery) showResults(documents, query);
+      } catch (error) {
+        console.error("Search failed:", error);
+      }
+    }, 120);
+  });
+})();
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Math delimiter benchmarks - Times build_site._convert_math_delimiters.
+
+Runs the scanner on the rendered HTML of the largest specs in the
+repository (plus a currency-heavy stress input) and compares it against
+the regex implementation it replaced. The regex version is kept here as
+the golden reference: any difference in output fails the run.
+
+Usage:
+    python scripts/benchmark_math.py
+    python scripts/benchmark_math.py --top 10 --repeat 20
+
+Exit Codes:
+    0 - Scanner output matches the reference on every input
+    1 - At least one input converted differently
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from build_site import _convert_math_delimiters, create_markdown
+
+
+def _regex_convert_math_delimiters(html: str) -> str:
+    """Reference implementation: the original split/sub based converter."""
+    parts = re.split(
+        r"(<code[^>]*>.*?</code>|<pre[^>]*>.*?</pre>)", html, flags=re.DOTALL
+    )
+    for i, part in enumerate(parts):
+        if part.startswith("<code") or part.startswith("<pre"):
+            continue
+        part = re.sub(r"\$\$([^\$]+?)\$\$", r"\\[\1\\]", part)
+        part = re.sub(
+            r"(?<!\$)\$(\S(?:[^\$\n<>]*?\S)?)\$(?!\$)",
+            r"\\(\1\\)",
+            part,
+        )
+        parts[i] = part
+    return "".join(parts)
+
+
+def _rendered_html(readme: Path) -> str:
+    """Render a README to HTML the way build_site does, minus math."""
+    content = readme.read_text(encoding="utf-8")
+    return create_markdown().convert(content)
+
+
+def _stress_html(rows: int) -> str:
+    """A table full of currency amounts and unclosed inline code."""
+    cells = "".join(
+        f"<td>${n}.{n % 100:02d}m fee $ {n} or ${n}</td>" for n in range(8)
+    )
+    row = f"<tr>{cells}<td><code>$x$</td></tr>\n"
+    return "<table>\n" + row * rows + "</table>\n"
+
+
+def collect_inputs(root_dir: Path, top: int) -> List[Tuple[str, str]]:
+    """Return (name, html) for the ``top`` largest specs and a stress input."""
+    readmes = sorted(
+        root_dir.glob("XLS-*/README.md"), key=lambda p: p.stat().st_size, reverse=True
+    )
+    inputs = [(path.parent.name, _rendered_html(path)) for path in readmes[:top]]
+    inputs.append(("stress[currency-table]", _stress_html(2000)))
+    return inputs
+
+
+def _best_time(func, html: str, repeat: int) -> float:
+    """Return the fastest wall time of ``repeat`` calls to func(html)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main entry point for the math delimiter benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark math delimiter conversion")
+    parser.add_argument(
+        "--top", type=int, default=5, help="Number of largest specs to use (default: 5)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Runs per input; fastest is kept"
+    )
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.resolve().parent
+    mismatches = []
+
+    print(f"{'input':<42}{'KiB':>8}{'scanner ms':>12}{'regex ms':>12}{'speedup':>10}")
+    for name, html in collect_inputs(root_dir, args.top):
+        if _convert_math_delimiters(html) != _regex_convert_math_delimiters(html):
+            mismatches.append(name)
+        scanner = _best_time(_convert_math_delimiters, html, args.repeat)
+        regex = _best_time(_regex_convert_math_delimiters, html, args.repeat)
+        print(
+            f"{name:<42}{len(html) // 1024:>8}{scanner * 1000:>12.2f}"
+            f"{regex * 1000:>12.2f}{regex / scanner:>9.1f}x"
+        )
+
+    if mismatches:
+        print("\nOUTPUT MISMATCHES:")
+        for name in mismatches:
+            print(f"  {name}")
+        return 1
+    print("\nScanner output matches the reference on every input.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Parser benchmarks - Measures xls_parser.py throughput on synthetic corpora.
+
+Each corpus size is generated with synthetic_corpus.py and measured in a
+fresh process, so that peak RSS is reported per size. Results can be saved
+as a baseline and later runs compared against it. Baselines are
+machine-specific, so there is no default location: pass the file to keep
+it in, outside the disposable .cache directory.
+
+Usage:
+    # Measure and record a baseline for this machine
+    python scripts/benchmark_parser.py --baseline parser.json --save-baseline
+
+    # Compare against it (exits 1 on regression)
+    python scripts/benchmark_parser.py --sizes 100 1000 --baseline parser.json
+
+Exit Codes:
+    0 - No regressions (or no baseline to compare against)
+    1 - At least one benchmark regressed beyond the threshold
+"""
+
+import contextlib
+import io
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import xls_parser
+from synthetic_corpus import generate_corpus
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+def _peak_rss_kb() -> int:
+    """Return this process's peak resident set size in KiB (0 if unknown)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _best_time(func, repeat: int) -> float:
+    """Return the fastest wall time of ``repeat`` calls to func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _measure(size: int, repeat: int) -> Dict[str, dict]:
+    """Generate a corpus of ``size`` documents and time the parser on it.
+
+    Runs in a child process; returns {benchmark: {seconds, docs_per_sec}}
+    plus the child's peak RSS.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        readmes = generate_corpus(root, size)
+        contents = [
+            (path.read_text(encoding="utf-8"), path.parent.name) for path in readmes
+        ]
+        quiet = contextlib.redirect_stdout(io.StringIO())
+
+        def extract():
+            for content, folder in contents:
+                xls_parser.extract_xls_metadata(content, folder)
+
+        def find_uncached():
+            with quiet:
+                xls_parser.find_xls_documents(root, use_cache=False)
+
+        def find_cached():
+            with quiet:
+                xls_parser.find_xls_documents(root, use_cache=True)
+
+        with quiet:
+            docs = xls_parser.find_xls_documents(root, use_cache=True)
+
+        def validate():
+            for doc in docs:
+                xls_parser.validate_xls_preamble(doc)
+
+        def validate_batch():
+            xls_parser.validate_xls_preambles(docs)
+
+        benchmarks = {
+            "extract_xls_metadata": extract,
+            "find_xls_documents": find_uncached,
+            "find_xls_documents[warm-cache]": find_cached,
+            "validate_xls_preamble": validate,
+            "validate_xls_preambles[batch]": validate_batch,
+        }
+        results = {}
+        for name, func in benchmarks.items():
+            seconds = _best_time(func, repeat)
+            results[name] = {
+                "seconds": round(seconds, 6),
+                "docs_per_sec": round(size / seconds, 1) if seconds else None,
+            }
+
+    return {"benchmarks": results, "peak_rss_kb": _peak_rss_kb()}
+
+
+def run_benchmarks(sizes: List[int], repeat: int) -> Dict[str, dict]:
+    """Run every benchmark at each size, one fresh process per size."""
+    context = multiprocessing.get_context("spawn")
+    report = {}
+    for size in sizes:
+        print(f"Benchmarking {size} documents...", flush=True)
+        with context.Pool(1) as pool:
+            report[str(size)] = pool.apply(_measure, (size, repeat))
+    return report
+
+
+def compare_to_baseline(
+    report: Dict[str, dict], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """Return a message for every benchmark slower than baseline by threshold."""
+    regressions = []
+    for size, result in report.items():
+        base = baseline.get(size)
+        if not base:
+            continue
+        for name, metrics in result["benchmarks"].items():
+            base_metrics = base["benchmarks"].get(name)
+            if not base_metrics or not base_metrics["docs_per_sec"]:
+                continue
+            ratio = metrics["docs_per_sec"] / base_metrics["docs_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append(
+                    f"{name} @ {size} docs: {metrics['docs_per_sec']:.0f} docs/sec "
+                    f"vs baseline {base_metrics['docs_per_sec']:.0f} "
+                    f"({(1 - ratio) * 100:.1f}% slower)"
+                )
+    return regressions
+
+
+def print_report(report: Dict[str, dict], baseline: Dict[str, dict]):
+    """Print a table of throughput and peak RSS per size."""
+    print(f"\n{'benchmark':<34}{'docs':>8}{'docs/sec':>14}{'baseline':>14}")
+    for size, result in report.items():
+        base = baseline.get(size, {}).get("benchmarks", {})
+        for name, metrics in result["benchmarks"].items():
+            base_rate = base.get(name, {}).get("docs_per_sec")
+            base_text = f"{base_rate:.0f}" if base_rate else "-"
+            print(
+                f"{name:<34}{size:>8}{metrics['docs_per_sec']:>14.0f}{base_text:>14}"
+            )
+        print(f"{'peak RSS (KiB)':<34}{size:>8}{result['peak_rss_kb']:>14}")
+
+
+def main():
+    """Main entry point for the parser benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark xls_parser.py")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Corpus sizes to benchmark (default: 100 1000 10000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per benchmark; fastest is kept"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON file to compare against, or to write with "
+        "--save-baseline",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run's results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed throughput drop before failing (default: 0.2 = 20%%)",
+    )
+    parser.add_argument("--output", type=Path, help="Also write the report here")
+    args = parser.parse_args()
+    if args.save_baseline and args.baseline is None:
+        parser.error("--save-baseline requires --baseline PATH")
+
+    report = run_benchmarks(args.sizes, args.repeat)
+
+    baseline = {}
+    if args.baseline and args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    for path in filter(None, [args.output, args.save_baseline and args.baseline]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {path}")
+
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
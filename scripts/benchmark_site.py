@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Site build benchmarks - Times build_site.py end to end.
+
+Builds the real corpus and synthetic corpora scaled to 1x, 10x and 50x its
+size (generated with synthetic_corpus.py) in three scenarios:
+
+    cold     No _site and empty caches
+    warm     Full rebuild with the metadata, highlight and search caches
+             left by the previous build
+    changed  Incremental rebuild after one README was edited
+
+Each corpus is copied to a temporary directory, and each scenario runs in
+a fresh process so that peak RSS is reported per scenario; the fastest of
+--repeat runs is kept. Wall time, CPU time, peak RSS and output bytes can
+be saved as a baseline and later runs compared against it. A time only
+counts as a regression when it is worse by both --threshold and
+--min-delta seconds, so sub-second scenarios do not fail on noise.
+
+Every generated file is also hashed and checked against golden hashes, so
+a performance change cannot silently change the rendered site. Warm
+builds must reproduce the cold build's output exactly.
+
+Baselines are machine-specific and golden hashes depend on the corpus, so
+neither has a default location: pass the files to keep them in, outside
+the disposable .cache directory.
+
+Usage:
+    # Record a baseline and golden hashes before a change
+    python scripts/benchmark_site.py --baseline site.json --save-baseline \\
+        --golden site-golden.json --update-golden
+
+    # Compare against them (exits 1 on regression or output drift)
+    python scripts/benchmark_site.py --baseline site.json --golden site-golden.json
+
+Exit Codes:
+    0 - No regressions and output matches the golden hashes
+    1 - A benchmark regressed beyond the threshold, or output changed
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from build_site import _site_base_url
+from synthetic_corpus import generate_corpus
+
+ROOT_DIR = Path(__file__).parent.resolve().parent
+DEFAULT_SCALES = [1, 10, 50]
+SCENARIOS = ("cold", "warm", "changed")
+# Metrics compared against the baseline; higher is worse for all of them
+BASELINE_METRICS = ("wall_seconds", "cpu_seconds", "peak_rss_kb")
+# Metrics that --min-delta applies to
+TIME_METRICS = ("wall_seconds", "cpu_seconds")
+
+# Appended to one README for the "changed" scenario
+_EDIT = "\n\nThis paragraph was added by benchmark_site.py.\n"
+
+
+def _rusage() -> tuple:
+    """Return (CPU seconds, peak RSS KiB) of this process and its children."""
+    try:
+        import resource
+    except ImportError:
+        return time.process_time(), 0
+    cpu = 0.0
+    peak = 0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        cpu += usage.ru_utime + usage.ru_stime
+        peak = max(peak, usage.ru_maxrss)
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return cpu, peak // 1024 if sys.platform == "darwin" else peak
+
+
+def prepare_corpus(dest: Path, scale: int) -> Path:
+    """Create a corpus under ``dest`` and return the README to edit.
+
+    Scale 0 copies the real XLS READMEs; any other scale generates that
+    many times as many synthetic documents.
+    """
+    real_readmes = sorted(ROOT_DIR.glob("XLS-*/README.md"))
+    if scale:
+        readmes = generate_corpus(dest, scale * len(real_readmes))
+    else:
+        readmes = []
+        for readme in real_readmes:
+            target = dest / readme.parent.name / "README.md"
+            target.parent.mkdir(parents=True)
+            shutil.copyfile(readme, target)
+            readmes.append(target)
+    shutil.copyfile(ROOT_DIR / "CONTRIBUTING.md", dest / "CONTRIBUTING.md")
+    return readmes[len(readmes) // 2]
+
+
+def _site_files(site_dir: Path) -> tuple:
+    """Return ({path: sha256} for every page and asset, total output bytes).
+
+    Precompressed .gz siblings count towards the bytes but are not hashed:
+    they are derived from the files next to them.
+    """
+    hashes = {}
+    total = 0
+    for path in sorted(site_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        data = path.read_bytes()
+        total += len(data)
+        if path.suffix != ".gz":
+            hashes[path.relative_to(site_dir).as_posix()] = hashlib.sha256(
+                data
+            ).hexdigest()
+    return hashes, total
+
+
+def _measure(root: str, edit_path: str, scenario: str, jobs: int, repeat: int) -> dict:
+    """Run one scenario ``repeat`` times and keep the fastest run.
+
+    Runs in a child process; returns the timings, this process's peak RSS
+    and the hashes of the site the last run produced.
+    """
+    from build_site import build_site
+
+    root = Path(root)
+    edit_path = Path(edit_path)
+    site_dir = root / "_site"
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    def build(incremental: bool):
+        with quiet:
+            build_site(
+                jobs=jobs, incremental=incremental, root_dir=root, site_dir=site_dir
+            )
+
+    best = None
+    for _ in range(repeat):
+        if scenario == "cold":
+            shutil.rmtree(root / ".cache", ignore_errors=True)
+            # _site is a symlink into the release under .cache
+            site_dir.unlink(missing_ok=True)
+        elif scenario == "changed":
+            # Undo the previous run's edit so every run changes one file
+            content = edit_path.read_text(encoding="utf-8")
+            if content.endswith(_EDIT):
+                edit_path.write_text(content[: -len(_EDIT)], encoding="utf-8")
+                build(incremental=True)
+            edit_path.write_text(content.removesuffix(_EDIT) + _EDIT, encoding="utf-8")
+
+        cpu_start = _rusage()[0]
+        start = time.perf_counter()
+        build(incremental=scenario == "changed")
+        wall = time.perf_counter() - start
+        cpu = _rusage()[0] - cpu_start
+        if best is None or wall < best[0]:
+            best = (wall, cpu)
+
+    hashes, output_bytes = _site_files(site_dir)
+    return {
+        "wall_seconds": round(best[0], 4),
+        "cpu_seconds": round(best[1], 4),
+        "peak_rss_kb": _rusage()[1],
+        "output_bytes": output_bytes,
+        "files": len(hashes),
+        "hashes": hashes,
+    }
+
+
+def run_benchmarks(scales: List[int], repeat: int, jobs: int) -> tuple:
+    """Run every scenario on the real corpus and each synthetic scale.
+
+    Returns:
+        (report, hashes): {corpus: {scenario: metrics}} and
+        {corpus: {scenario: {path: sha256}}}
+    """
+    context = multiprocessing.get_context("spawn")
+    report: Dict[str, dict] = {}
+    hashes: Dict[str, dict] = {}
+    for scale in [0, *scales]:
+        name = f"synthetic-{scale}x" if scale else "real"
+        with tempfile.TemporaryDirectory() as tmp:
+            edit_path = prepare_corpus(Path(tmp), scale)
+            documents = len(list(Path(tmp).glob("XLS-*")))
+            report[name] = {}
+            hashes[name] = {}
+            for scenario in SCENARIOS:
+                print(f"Benchmarking {name} ({documents} documents): {scenario}...")
+                with context.Pool(1) as pool:
+                    result = pool.apply(
+                        _measure, (tmp, str(edit_path), scenario, jobs, repeat)
+                    )
+                hashes[name][scenario] = result.pop("hashes")
+                report[name][scenario] = dict(result, documents=documents)
+    return report, hashes
+
+
+def compare_to_baseline(
+    report: Dict[str, dict],
+    baseline: Dict[str, dict],
+    threshold: float,
+    min_delta: float = 0.0,
+) -> List[str]:
+    """Return a message for every metric worse than baseline by threshold.
+
+    Times must also be at least min_delta seconds worse.
+    """
+    regressions = []
+    for corpus, scenarios in report.items():
+        for scenario, metrics in scenarios.items():
+            base = baseline.get(corpus, {}).get(scenario)
+            if not base:
+                continue
+            for metric in BASELINE_METRICS:
+                if not base.get(metric):
+                    continue
+                ratio = metrics[metric] / base[metric]
+                delta = metrics[metric] - base[metric]
+                if metric in TIME_METRICS and delta < min_delta:
+                    continue
+                if ratio > 1 + threshold:
+                    regressions.append(
+                        f"{corpus} {scenario}: {metric} {metrics[metric]} vs "
+                        f"baseline {base[metric]} ({(ratio - 1) * 100:.1f}% worse)"
+                    )
+    return regressions
+
+
+def _diff_hashes(label: str, actual: dict, expected: dict, limit: int = 10) -> List[str]:
+    """Describe the files that differ between two {path: sha256} maps."""
+    changed = sorted(
+        path
+        for path in actual.keys() | expected.keys()
+        if actual.get(path) != expected.get(path)
+    )
+    messages = []
+    for path in changed[:limit]:
+        if path not in expected:
+            what = "new file"
+        elif path not in actual:
+            what = "missing"
+        else:
+            what = "content changed"
+        messages.append(f"{label}: {path} ({what})")
+    if len(changed) > limit:
+        messages.append(f"{label}: ... and {len(changed) - limit} more file(s)")
+    return messages
+
+
+def check_output(hashes: Dict[str, dict], golden: dict) -> List[str]:
+    """Return a message for every output that differs from what it should be.
+
+    Warm builds must match the cold build, and every scenario must match
+    its golden hashes when the golden file has them.
+    """
+    problems = []
+    for corpus, scenarios in hashes.items():
+        if "cold" in scenarios and "warm" in scenarios:
+            problems += _diff_hashes(
+                f"{corpus} warm vs cold", scenarios["warm"], scenarios["cold"]
+            )
+        for scenario, files in scenarios.items():
+            expected = golden.get("corpora", {}).get(corpus, {}).get(scenario)
+            if expected is not None:
+                problems += _diff_hashes(
+                    f"{corpus} {scenario} vs golden", files, expected
+                )
+    return problems
+
+
+def print_report(report: Dict[str, dict], baseline: Dict[str, dict]):
+    """Print a table of the metrics of every corpus and scenario."""
+    print(
+        f"\n{'corpus':<16}{'scenario':<10}{'docs':>7}{'wall s':>10}{'baseline':>10}"
+        f"{'cpu s':>10}{'RSS KiB':>10}{'output KiB':>12}{'files':>8}"
+    )
+    for corpus, scenarios in report.items():
+        for scenario, metrics in scenarios.items():
+            base = baseline.get(corpus, {}).get(scenario, {}).get("wall_seconds")
+            base_text = f"{base:.2f}" if base else "-"
+            print(
+                f"{corpus:<16}{scenario:<10}{metrics['documents']:>7}"
+                f"{metrics['wall_seconds']:>10.2f}{base_text:>10}"
+                f"{metrics['cpu_seconds']:>10.2f}{metrics['peak_rss_kb']:>10}"
+                f"{metrics['output_bytes'] // 1024:>12}{metrics['files']:>8}"
+            )
+
+
+def _write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    print(f"Wrote {path}")
+
+
+def main():
+    """Main entry point for the site build benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark build_site.py")
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="*",
+        default=DEFAULT_SCALES,
+        help="Synthetic corpus sizes, as multiples of the real corpus "
+        "(default: 1 10 50; pass no values to build only the real corpus)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per scenario; fastest is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Render processes per build (default: 1)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON file to compare against, or to write with "
+        "--save-baseline",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run's results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed increase in wall time, CPU time or peak RSS before "
+        "failing (default: 0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.1,
+        help="Smallest increase in wall or CPU seconds that counts as a "
+        "regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "--golden",
+        type=Path,
+        help="Golden output hashes to check against, or to write with "
+        "--update-golden",
+    )
+    parser.add_argument(
+        "--update-golden",
+        action="store_true",
+        help="Store this run's output hashes as the new golden outputs",
+    )
+    parser.add_argument("--output", type=Path, help="Also write the report here")
+    args = parser.parse_args()
+    if args.save_baseline and args.baseline is None:
+        parser.error("--save-baseline requires --baseline PATH")
+    if args.update_golden and args.golden is None:
+        parser.error("--update-golden requires --golden PATH")
+
+    report, hashes = run_benchmarks(args.scales, args.repeat, args.jobs)
+
+    baseline = {}
+    if args.baseline and args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # Pages embed the base URL, so hashes are only comparable for the same one
+    base_url = _site_base_url()
+    golden = {}
+    if args.golden and args.golden.exists() and not args.update_golden:
+        with open(args.golden, "r", encoding="utf-8") as f:
+            golden = json.load(f)
+        if golden.get("base_url") != base_url:
+            print(
+                f"Warning: golden hashes were recorded for base URL "
+                f"{golden.get('base_url')!r}, not {base_url!r}; not comparing"
+            )
+            golden = {}
+
+    print_report(report, baseline)
+    print()
+
+    for path in filter(None, [args.output, args.save_baseline and args.baseline]):
+        _write_json(path, report)
+    if args.update_golden:
+        _write_json(args.golden, {"base_url": base_url, "corpora": hashes})
+
+    failed = False
+    regressions = compare_to_baseline(
+        report, baseline, args.threshold, args.min_delta
+    )
+    if regressions:
+        print("\nREGRESSIONS:")
+        for message in regressions:
+            print(f"  {message}")
+        failed = True
+
+    problems = check_output(hashes, golden)
+    if problems:
+        print("\nOUTPUT CHANGES:")
+        for message in problems:
+            print(f"  {message}")
+        failed = True
+    elif golden:
+        print("\nOutput matches the golden hashes.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
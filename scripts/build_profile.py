@@ -0,0 +1,283 @@
+"""
+Build profiler for the XLS Standards site builder.
+
+Records wall time, CPU time and tracemalloc peak for every build phase
+(loading the corpus, rendering pages, writing redirects, ...) and for
+every XLS document, broken down into steps (read, markdown, highlight,
+math, template, terms, write). Worker processes of a parallel build
+profile their own documents and send the spans back with each page.
+
+Outputs (written by build_site.py --profile):
+    profile.json  Phases, step totals and per-document timings
+    trace.json    Chrome trace events; open in chrome://tracing or
+                  https://ui.perfetto.dev (loaded locally in the browser)
+
+Usage:
+    python scripts/build_site.py --profile
+    python scripts/build_site.py --profile /tmp/profile --profile-top 20
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List
+
+# Bump when the layout of profile.json changes
+PROFILE_VERSION = 1
+
+_NULL_SPAN = nullcontext()
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: every span is a no-op."""
+
+    enabled = False
+
+    def span(self, name: str, category: str = "step", **args):
+        return _NULL_SPAN
+
+    def phase(self, name: str):
+        pass
+
+
+class BuildProfiler:
+    """Collects timed spans for one process.
+
+    Spans nest: a document span contains its steps, and every span opened
+    while a phase is running belongs to that phase. The memory figure of a
+    span is its tracemalloc peak above the memory allocated when it began,
+    including the peaks of the spans nested inside it.
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.origin = time.perf_counter()
+        self.spans: List[dict] = []
+        # Open spans, innermost last, as [span, allocated at start, peak]
+        self._stack: List[list] = []
+        self._phase = None
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _open(self, name: str, category: str, args: dict) -> list:
+        allocated, peak = self._memory()
+        if self._stack:
+            # Steps inside a document span belong to that document
+            folder = self._stack[-1][0]["args"].get("folder")
+            if folder is not None:
+                args = {"folder": folder, **args}
+            # Fold the peak reached so far into the enclosing span before
+            # resetting it for this one
+            self._stack[-1][2] = max(self._stack[-1][2], peak)
+            self._reset_peak()
+        span = {
+            "name": name,
+            "cat": category,
+            "pid": os.getpid(),
+            "start": time.perf_counter(),
+            "cpu_start": time.process_time(),
+            "args": args,
+        }
+        frame = [span, allocated, allocated]
+        self._stack.append(frame)
+        return frame
+
+    def _close(self, frame: list):
+        span, allocated, peak = frame
+        span["wall"] = time.perf_counter() - span["start"]
+        span["cpu"] = time.process_time() - span.pop("cpu_start")
+        peak = max(peak, self._memory()[1])
+        span["peak_bytes"] = peak - allocated
+        self._stack.remove(frame)
+        if self._stack:
+            self._stack[-1][2] = max(self._stack[-1][2], peak)
+        self._reset_peak()
+        self.spans.append(span)
+
+    def _memory(self) -> tuple:
+        if self.trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()
+        return (0, 0)
+
+    def _reset_peak(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", **args):
+        """Time the enclosed block as one span."""
+        frame = self._open(name, category, args)
+        try:
+            yield
+        finally:
+            self._close(frame)
+
+    def phase(self, name: str):
+        """End the current build phase, if any, and start the next one."""
+        if self._phase is not None:
+            self._close(self._phase)
+        self._phase = self._open(name, "phase", {}) if name else None
+
+    def finish(self):
+        """End the last phase and stop tracing memory."""
+        self.phase(None)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def drain(self) -> List[dict]:
+        """Return and forget the finished spans (used by worker processes)."""
+        spans, self.spans = self.spans, []
+        return spans
+
+    def extend(self, spans: List[dict]):
+        """Add spans recorded by another process."""
+        self.spans.extend(spans)
+
+    def report(self) -> dict:
+        """Summarize the spans as phases, step totals and documents."""
+        phases = [_timing(span) for span in self.spans if span["cat"] == "phase"]
+
+        steps: Dict[str, dict] = {}
+        documents: Dict[str, dict] = {}
+        for span in self.spans:
+            folder = span["args"].get("folder")
+            if span["cat"] == "document":
+                doc = documents.setdefault(folder, _document(folder))
+                doc["wall_ms"] += _ms(span["wall"])
+                doc["cpu_ms"] += _ms(span["cpu"])
+                doc["peak_kib"] = max(doc["peak_kib"], _kib(span["peak_bytes"]))
+            elif span["cat"] == "step":
+                step = steps.setdefault(
+                    span["name"], {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+                )
+                step["count"] += 1
+                step["wall_ms"] += _ms(span["wall"])
+                step["cpu_ms"] += _ms(span["cpu"])
+                if folder is not None:
+                    doc = documents.setdefault(folder, _document(folder))
+                    doc["steps"][span["name"]] = (
+                        doc["steps"].get(span["name"], 0.0) + _ms(span["wall"])
+                    )
+                    # Steps outside the render span (read, write) add to
+                    # the document's total
+                    if span["name"] in ("read", "write"):
+                        doc["wall_ms"] += _ms(span["wall"])
+                        doc["cpu_ms"] += _ms(span["cpu"])
+
+        for entry in [*steps.values(), *documents.values()]:
+            entry["wall_ms"] = round(entry["wall_ms"], 3)
+            entry["cpu_ms"] = round(entry["cpu_ms"], 3)
+        for doc in documents.values():
+            doc["steps"] = {name: round(ms, 3) for name, ms in doc["steps"].items()}
+
+        return {
+            "version": PROFILE_VERSION,
+            "wall_ms": round(sum(phase["wall_ms"] for phase in phases), 3),
+            "cpu_ms": round(sum(phase["cpu_ms"] for phase in phases), 3),
+            "trace_memory": self.trace_memory,
+            "phases": phases,
+            # Highlight time is also counted in markdown, which calls it
+            "steps": dict(sorted(steps.items())),
+            "documents": sorted(
+                documents.values(), key=lambda doc: doc["wall_ms"], reverse=True
+            ),
+        }
+
+    def trace_events(self) -> dict:
+        """Return the spans in the Chrome trace event format."""
+        main_pid = os.getpid()
+        events = []
+        for pid in sorted({span["pid"] for span in self.spans}):
+            name = "build" if pid == main_pid else f"render worker {pid}"
+            events.append(
+                {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            )
+        for span in sorted(self.spans, key=lambda span: span["start"]):
+            events.append(
+                {
+                    "name": span["name"],
+                    "cat": span["cat"],
+                    "ph": "X",
+                    "ts": round((span["start"] - self.origin) * 1e6, 3),
+                    "dur": round(span["wall"] * 1e6, 3),
+                    "pid": span["pid"],
+                    "tid": span["pid"],
+                    "args": dict(
+                        span["args"],
+                        cpu_ms=_ms(span["cpu"]),
+                        peak_kib=_kib(span["peak_bytes"]),
+                    ),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, profile_dir: Path) -> Dict[str, Path]:
+        """Write profile.json and trace.json into profile_dir."""
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "profile": profile_dir / "profile.json",
+            "trace": profile_dir / "trace.json",
+        }
+        with open(paths["profile"], "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        with open(paths["trace"], "w", encoding="utf-8") as f:
+            json.dump(self.trace_events(), f, separators=(",", ":"))
+        return paths
+
+    def print_summary(self, top: int = 10):
+        """Print phase timings, step totals and the slowest documents."""
+        report = self.report()
+        memory = "peak KiB" if self.trace_memory else ""
+
+        print(f"\n{'phase':<24}{'wall ms':>12}{'cpu ms':>12}{memory:>12}")
+        for phase in report["phases"]:
+            peak = phase["peak_kib"] if self.trace_memory else ""
+            print(
+                f"{phase['name']:<24}{phase['wall_ms']:>12.1f}"
+                f"{phase['cpu_ms']:>12.1f}{peak:>12}"
+            )
+        print(f"{'total':<24}{report['wall_ms']:>12.1f}{report['cpu_ms']:>12.1f}")
+
+        if report["steps"]:
+            print(f"\n{'step':<24}{'count':>12}{'wall ms':>12}{'cpu ms':>12}")
+            for name, step in report["steps"].items():
+                print(
+                    f"{name:<24}{step['count']:>12}{step['wall_ms']:>12.1f}"
+                    f"{step['cpu_ms']:>12.1f}"
+                )
+
+        documents = report["documents"][:top]
+        if documents:
+            print(f"\nSlowest {len(documents)} document(s):")
+            print(f"{'document':<48}{'wall ms':>10}{memory:>10}  slowest steps")
+            for doc in documents:
+                slowest = sorted(doc["steps"].items(), key=lambda s: -s[1])[:3]
+                steps = ", ".join(f"{name} {ms:.1f}" for name, ms in slowest)
+                peak = doc["peak_kib"] if self.trace_memory else ""
+                print(f"{doc['folder']:<48}{doc['wall_ms']:>10.1f}{peak:>10}  {steps}")
+
+
+def _timing(span: dict) -> dict:
+    return {
+        "name": span["name"],
+        "wall_ms": _ms(span["wall"]),
+        "cpu_ms": _ms(span["cpu"]),
+        "peak_kib": _kib(span["peak_bytes"]),
+    }
+
+
+def _document(folder: str) -> dict:
+    return {"folder": folder, "wall_ms": 0.0, "cpu_ms": 0.0, "peak_kib": 0, "steps": {}}
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _kib(size: int) -> int:
+    return round(size / 1024)
@@ -4,16 +4,168 @@ Build script for XLS Standards static site generator.
 Converts markdown XLS files to HTML and creates an index page.
 """
 
+import gzip
+import hashlib
+import json
 import os
 import re
 import shutil
-from collections import Counter
+import sys
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
 
 import markdown
-from jinja2 import Environment, FileSystemLoader
+import jinja2
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+)
+from markdown.extensions import codehilite, fenced_code
 
-from xls_parser import find_xls_documents
+try:
+    import pygments
+except ImportError:  # codehilite falls back to plain escaped <pre> blocks
+    pygments = None
+
+from build_profile import BuildProfiler, NullProfiler
+from search_index import SearchIndexBuilder, SearchTermCache, document_terms
+from xls_parser import XLSCorpus, XLSDocument, read_xls_content
+
+# Location of the incremental build manifest, relative to the repository root
+BUILD_MANIFEST_PATH = Path(".cache") / "site" / "manifest.json"
+# How often watch mode checks sources for changes
+WATCH_POLL_SECONDS = 0.25
+# Site releases: each build renders a new one, and _site is a symlink to
+# the release currently published
+SITE_RELEASES_DIR = Path(".cache") / "site" / "releases"
+# Default location of the changed/unchanged/deleted report for deploy tooling
+BUILD_CHANGES_PATH = Path(".cache") / "site" / "changes.json"
+# Hex digits of the content hash in fingerprinted asset names
+ASSET_HASH_LENGTH = 10
+# Outputs that get a precompressed .gz sibling
+PRECOMPRESSED_SUFFIXES = (".html", ".css", ".json")
+# How /xls/xls-<number>.html aliases are published: one redirect page per
+# alias, one redirect table with server exporters, or both
+REDIRECT_MODES = ("pages", "map", "both")
+# Rows rendered server-side on the index and category pages; the rest are
+# paged in from catalog.json by assets/catalog.js
+CATALOG_PAGE_SIZE = 25
+# Per-page search terms, reused for pages an incremental build skips
+SEARCH_TERMS_PATH = Path(".cache") / "site" / "search-terms.json"
+# Default directory for --profile reports (profile.json, trace.json)
+PROFILE_DIR = Path(".cache") / "site" / "profile"
+# Location of the on-disk syntax highlighting cache, relative to the repository root
+HIGHLIGHT_CACHE_DIR = Path(".cache") / "highlight"
+# Size the on-disk highlight cache is pruned back to after a build
+HIGHLIGHT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Precompiled template modules, relative to the repository root
+TEMPLATE_CACHE_DIR = Path(".cache") / "templates"
+
+
+# Start of a code span or preformatted block in rendered HTML
+_CODE_TAG_RE = re.compile(r"<(code|pre)")
+# Characters that end the body of an inline $...$ span
+_INLINE_MATH_STOP_RE = re.compile(r"[$\n<>]")
+
+
+def _iter_code_blocks(html: str) -> Iterator[tuple]:
+    """Yield (prose, code) pairs covering html in order.
+
+    A code block runs from an opening <code ...> or <pre ...> tag to the
+    first matching closing tag; an opening tag that is never closed is left
+    in the prose. The final pair has an empty code block.
+    """
+    pos = 0
+    search_from = 0
+    unclosed = set()
+    while True:
+        match = _CODE_TAG_RE.search(html, search_from)
+        if match is None:
+            break
+        start, tag = match.start(), match.group(1)
+        tag_end = html.find(">", match.end())
+        if tag_end == -1:
+            # No later tag can be closed either
+            break
+        close = -1 if tag in unclosed else html.find(f"</{tag}>", tag_end + 1)
+        if close == -1:
+            unclosed.add(tag)
+            search_from = start + 1
+            continue
+        end = close + len(tag) + 3
+        yield html[pos:start], html[start:end]
+        pos = search_from = end
+    yield html[pos:], ""
+
+
+def _convert_display_math(text: str) -> str:
+    """Convert $$...$$ (with no $ inside) to \\[...\\]."""
+    out = []
+    pos = 0
+    start = text.find("$$")
+    while start != -1:
+        close = text.find("$", start + 2)
+        if close == -1:
+            break
+        if close > start + 2 and text.startswith("$$", close):
+            out += (text[pos:start], "\\[", text[start + 2 : close], "\\]")
+            pos = close + 2
+            start = text.find("$$", pos)
+        else:
+            start = text.find("$$", start + 1)
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def _convert_inline_math(text: str) -> str:
+    """Convert $...$ to \\(...\\).
+
+    The opening $ must not follow another $ and must be followed by a
+    non-whitespace character; the closing $ must follow a non-whitespace
+    character and not be followed by another $. The body may not contain
+    $, newlines or HTML tag brackets, except as its first or last character.
+    """
+    out = []
+    pos = 0
+    length = len(text)
+    start = text.find("$")
+    while start != -1:
+        close = -1
+        if (
+            (start == 0 or text[start - 1] != "$")
+            and start + 1 < length
+            and not text[start + 1].isspace()
+        ):
+            stop = _INLINE_MATH_STOP_RE.search(text, start + 2)
+            if stop is not None:
+                stop = stop.start()
+                if (
+                    text[stop] == "$"
+                    and not text[stop - 1].isspace()
+                    and not text.startswith("$", stop + 1)
+                ):
+                    close = stop
+                elif (
+                    text[stop] != "\n"
+                    and text.startswith("$", stop + 1)
+                    and not text.startswith("$", stop + 2)
+                ):
+                    close = stop + 1
+        if close == -1:
+            start = text.find("$", start + 1)
+            continue
+        out += (text[pos:start], "\\(", text[start + 1 : close], "\\)")
+        pos = close + 1
+        start = text.find("$", pos)
+    out.append(text[pos:])
+    return "".join(out)
 
 
 def _convert_math_delimiters(html: str) -> str:
@@ -22,39 +174,34 @@ def _convert_math_delimiters(html: str) -> str:
     Only matches when the closing delimiter is NOT preceded by whitespace,
     which avoids false positives on currency like "$1.0m ... $1.0m".
     Skips content inside <code> and <pre> tags.
+
+    Runs in linear time: code blocks, display math and inline math are
+    each found with forward-only scans, with no regex backtracking.
     """
-    # Split the HTML into segments: code/pre blocks vs. everything else.
-    # Process only non-code segments.
-    parts = re.split(
-        r"(<code[^>]*>.*?</code>|<pre[^>]*>.*?</pre>)", html, flags=re.DOTALL
-    )
-    for i, part in enumerate(parts):
-        if part.startswith("<code") or part.startswith("<pre"):
-            continue
-        # Display math $$...$$ → \[...\]
-        part = re.sub(r"\$\$([^\$]+?)\$\$", r"\\[\1\\]", part)
-        # Inline math $...$ → \(...\)
-        # Require: non-whitespace after opening $ and before closing $.
-        # Disallow newlines and HTML tags (<, >) inside the match to
-        # prevent spanning across HTML element boundaries.
-        part = re.sub(
-            r"(?<!\$)\$(\S(?:[^\$\n<>]*?\S)?)\$(?!\$)",
-            r"\\(\1\\)",
-            part,
-        )
-        parts[i] = part
+    parts = []
+    for prose, code in _iter_code_blocks(html):
+        if prose.startswith(("<code", "<pre")):
+            # An unclosed code tag at the start of a run stays untouched
+            parts.append(prose)
+        else:
+            parts.append(_convert_inline_math(_convert_display_math(prose)))
+        parts.append(code)
     return "".join(parts)
 
 
-def convert_markdown_to_html(content: str) -> str:
-    """Convert markdown content to HTML."""
-    # Insert a TOC marker after the first metadata block, unless one already exists.
-    if "[TOC]" not in content:
-        content = re.sub(r"</pre>", "</pre>\n\n[TOC]\n\n", content, count=1)
-    content = re.sub(r"\.\./(XLS-[0-9A-Za-z-]+)/README\.md", r"./\1.html", content)
+def create_markdown(
+    highlight_cache: Optional["HighlightCache"] = None, profiler=None
+) -> markdown.Markdown:
+    """Create the Markdown converter used for all site pages.
 
-    md = markdown.Markdown(
-        extensions=["extra", "codehilite", "toc", "tables"],
+    With a highlight_cache, code blocks are highlighted through it (see
+    HighlightCacheExtension); profiler times each block as a highlight step.
+    """
+    extensions = ["extra", "codehilite", "toc", "tables"]
+    if highlight_cache is not None:
+        extensions.append(HighlightCacheExtension(highlight_cache, profiler))
+    return markdown.Markdown(
+        extensions=extensions,
         extension_configs={
             "codehilite": {"css_class": "highlight"},
             "toc": {
@@ -65,185 +212,1224 @@ def convert_markdown_to_html(content: str) -> str:
             },
         },
     )
-    html = md.convert(content)
+
+
+def convert_markdown_to_html(
+    content: str, md: markdown.Markdown = None, profiler=None
+) -> str:
+    """Convert markdown content to HTML.
+
+    Args:
+        content: Markdown source
+        md: Optional converter from create_markdown() to reuse; it is reset
+            before use. A new converter is created when omitted.
+        profiler: Optional BuildProfiler timing the Markdown and math steps
+    """
+    profiler = profiler or NullProfiler()
+    # Insert a TOC marker after the first metadata block, unless one already exists.
+    if "[TOC]" not in content:
+        content = re.sub(r"</pre>", "</pre>\n\n[TOC]\n\n", content, count=1)
+    content = re.sub(r"\.\./(XLS-[0-9A-Za-z-]+)/README\.md", r"./\1.html", content)
+
+    if md is None:
+        md = create_markdown()
+    else:
+        md.reset()
+    with profiler.span("markdown"):
+        html = md.convert(content)
 
     # Convert LaTeX math delimiters after markdown processing so that
     # the markdown processor doesn't strip backslashes from \(...\).
-    html = _convert_math_delimiters(html)
+    with profiler.span("math"):
+        html = _convert_math_delimiters(html)
 
     return html
 
 
-def build_site():
-    """Main function to build the static site."""
+class HighlightCache:
+    """Cache of syntax-highlighted code blocks.
 
-    # Setup directories
-    source_dir = Path(__file__).parent.resolve()
-    root_dir = source_dir.parent
-    site_dir = source_dir / "_site"
-    template_dir = source_dir / "templates"
-    assets_dir = source_dir / "assets"
+    Entries are keyed by a hash of the code, its language, the codehilite
+    options and the Pygments version, so unchanged blocks skip Pygments
+    even when the surrounding document changed. Recently used entries are
+    kept in an in-memory LRU; with a cache_dir, entries are also stored one
+    file per block so they survive between builds and are shared by the
+    processes of a parallel build. Reading an entry from disk marks it as
+    recently used, and prune() drops the least recently used files.
+    """
 
-    # Set base URL for GitHub Pages (can be overridden with env var)
-    base_url = (
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 4096):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def key(src: str, lang: Optional[str], shebang: bool, options: dict) -> str:
+        """Return the cache key for one code block."""
+        return _hash_inputs(
+            pygments.__version__ if pygments else None,
+            lang,
+            shebang,
+            options,
+            src,
+        )
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.html"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached HTML for a key, or None on a miss."""
+        html = self._entries.get(key)
+        if html is None and self.cache_dir:
+            path = self._entry_path(key)
+            try:
+                html = path.read_text(encoding="utf-8")
+                os.utime(path)
+            except OSError:
+                html = None
+            else:
+                self._remember(key, html)
+        if html is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return html
+
+    def put(self, key: str, html: str):
+        """Store highlighted HTML in memory and, if enabled, on disk."""
+        self._remember(key, html)
+        if self.cache_dir:
+            path = self._entry_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(html, encoding="utf-8")
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Warning: could not write highlight cache entry: {e}")
+
+    def prune(self, max_bytes: int = HIGHLIGHT_CACHE_MAX_BYTES) -> int:
+        """Delete the least recently used entries on disk until the rest fit
+        in max_bytes. Returns the number of entries deleted."""
+        if not self.cache_dir or not self.cache_dir.exists():
+            return 0
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.html"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        deleted = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            deleted += 1
+        return deleted
+
+    def _remember(self, key: str, html: str):
+        self._entries[key] = html
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedCodeHilite(codehilite.CodeHilite):
+    """CodeHilite that looks blocks up in a HighlightCache before Pygments."""
+
+    def __init__(
+        self,
+        src: str,
+        cache: Optional[HighlightCache] = None,
+        profiler=None,
+        **options,
+    ):
+        super().__init__(src, **options)
+        self.cache = cache
+        self.profiler = profiler or NullProfiler()
+
+    def hilite(self, shebang: bool = True) -> str:
+        with self.profiler.span("highlight"):
+            return self._cached_hilite(shebang)
+
+    def _cached_hilite(self, shebang: bool) -> str:
+        # A formatter class cannot be keyed reliably, so bypass the cache
+        if self.cache is None or not isinstance(self.pygments_formatter, str):
+            return super().hilite(shebang)
+
+        options = dict(
+            self.options,
+            guess_lang=self.guess_lang,
+            use_pygments=self.use_pygments,
+            lang_prefix=self.lang_prefix,
+            pygments_formatter=self.pygments_formatter,
+        )
+        key = self.cache.key(self.src, self.lang, shebang, options)
+        html = self.cache.get(key)
+        if html is None:
+            html = super().hilite(shebang)
+            self.cache.put(key, html)
+        return html
+
+
+class _CachedHiliteTreeprocessor(codehilite.HiliteTreeprocessor):
+    """codehilite's tree processor, highlighting through the extension's cache."""
+
+    def __init__(self, md: markdown.Markdown, extension: "HighlightCacheExtension"):
+        super().__init__(md)
+        self.extension = extension
+
+    def run(self, root):
+        for block in root.iter("pre"):
+            if len(block) == 1 and block[0].tag == "code":
+                local_config = self.config.copy()
+                text = block[0].text
+                if text is None:
+                    continue
+                code = self.extension.code_hilite(
+                    self.code_unescape(text),
+                    tab_length=self.md.tab_length,
+                    style=local_config.pop("pygments_style", "default"),
+                    **local_config,
+                )
+                placeholder = self.md.htmlStash.store(code.hilite())
+                block.clear()
+                block.tag = "p"
+                block.text = placeholder
+
+
+class _CachedFencedBlockPreprocessor(fenced_code.FencedBlockPreprocessor):
+    """Highlights plain ```lang fences through the extension's cache.
+
+    Runs just before fenced_code, which still handles fences with an
+    {attribute} list.
+    """
+
+    def __init__(
+        self,
+        md: markdown.Markdown,
+        extension: "HighlightCacheExtension",
+        codehilite_conf: dict,
+    ):
+        super().__init__(md, {})
+        self.extension = extension
+        self.codehilite_conf = codehilite_conf
+
+    def run(self, lines: List[str]) -> List[str]:
+        text = "\n".join(lines)
+        index = 0
+        while True:
+            m = self.FENCED_BLOCK_RE.search(text, index)
+            if m is None:
+                break
+            if m.group("attrs"):
+                index = m.end()
+                continue
+            local_config = self.codehilite_conf.copy()
+            if m.group("hl_lines"):
+                local_config["hl_lines"] = fenced_code.parse_hl_lines(
+                    m.group("hl_lines")
+                )
+            code = self.extension.code_hilite(
+                m.group("code"),
+                lang=m.group("lang") or None,
+                style=local_config.pop("pygments_style", "default"),
+                **local_config,
+            ).hilite(shebang=False)
+            placeholder = self.md.htmlStash.store(code)
+            text = f"{text[:m.start()]}\n{placeholder}\n{text[m.end():]}"
+            index = m.start() + 1 + len(placeholder)
+        return text.split("\n")
+
+
+class HighlightCacheExtension(markdown.Extension):
+    """Route one Markdown instance's code highlighting through a HighlightCache.
+
+    Load it after codehilite: it replaces codehilite's tree processor and
+    adds a fenced code preprocessor ahead of fenced_code, both building
+    CachedCodeHilite with this extension's cache and profiler. Other
+    Markdown instances in the process are not affected.
+    """
+
+    def __init__(self, cache: HighlightCache, profiler=None):
+        super().__init__()
+        self.cache = cache
+        self.profiler = profiler or NullProfiler()
+
+    def code_hilite(self, src: str, **options) -> CachedCodeHilite:
+        return CachedCodeHilite(src, self.cache, self.profiler, **options)
+
+    def extendMarkdown(self, md: markdown.Markdown):
+        if "hilite" not in md.treeprocessors:
+            return
+        config = md.treeprocessors["hilite"].config
+        hiliter = _CachedHiliteTreeprocessor(md, self)
+        hiliter.config = config
+        md.treeprocessors.register(hiliter, "hilite", 30)
+        if config["use_pygments"] and "fenced_code_block" in md.preprocessors:
+            md.preprocessors.register(
+                _CachedFencedBlockPreprocessor(md, self, config),
+                "cached_fenced_code_block",
+                26,
+            )
+        md.registerExtension(self)
+
+
+def _templates_hash(template_dir: Path) -> str:
+    """Hash the template sources and the Jinja version that compiles them."""
+    parts = [jinja2.__version__]
+    for path in sorted(template_dir.rglob("*")):
+        if path.is_file():
+            parts.extend([str(path.relative_to(template_dir)), path.read_bytes()])
+    return _hash_inputs(*parts)
+
+
+def precompile_templates(template_dir: Path, target: Path):
+    """Compile every template into an importable module directory.
+
+    The modules are written to a temporary directory that is renamed to
+    ``target`` when complete, so concurrent builds never see a partial set.
+    """
+    env = Environment(loader=FileSystemLoader(template_dir))
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    env.compile_templates(
+        tmp_dir, zip=None, ignore_errors=False, log_function=lambda message: None
+    )
+    try:
+        os.replace(tmp_dir, target)
+    except OSError:
+        # Another build installed the same templates first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ModuleLoader per precompiled template directory. Every loader registers a
+# package in sys.modules, so renderers share one until the templates change.
+_module_loaders: Dict[Path, ModuleLoader] = {}
+
+
+def _module_loader(compiled_dir: Path) -> ModuleLoader:
+    """Return the ModuleLoader for compiled_dir, dropping any older ones."""
+    loader = _module_loaders.get(compiled_dir)
+    if loader is None:
+        for old_loader in _module_loaders.values():
+            # Forget the template modules imported through the old package
+            prefix = f"{old_loader.package_name}."
+            for name in [name for name in sys.modules if name.startswith(prefix)]:
+                del sys.modules[name]
+        _module_loaders.clear()
+        loader = _module_loaders[compiled_dir] = ModuleLoader(compiled_dir)
+    return loader
+
+
+def create_template_environment(
+    template_dir: Path, cache_dir: Optional[Path] = None
+) -> Environment:
+    """Create the Jinja environment for the site templates.
+
+    With a cache_dir, templates are loaded from modules precompiled from
+    the current sources (compiled on first use), so starting a build or a
+    worker process does not lex and compile them again. The module loader
+    is reused while the template sources are unchanged (see _module_loader).
+    Anything missing from the modules falls back to the template directory.
+    """
+    loader = FileSystemLoader(template_dir)
+    if cache_dir is None:
+        return Environment(loader=loader)
+
+    compiled_dir = cache_dir / "compiled" / _templates_hash(template_dir)
+    if not compiled_dir.exists():
+        precompile_templates(template_dir, compiled_dir)
+        # Drop modules compiled from older template sources
+        for old_dir in compiled_dir.parent.iterdir():
+            if old_dir != compiled_dir and not old_dir.name.endswith(".tmp"):
+                shutil.rmtree(old_dir, ignore_errors=True)
+
+    return Environment(loader=ChoiceLoader([_module_loader(compiled_dir), loader]))
+
+
+class SiteRenderer:
+    """Markdown pipeline and compiled templates shared by a whole build.
+
+    Building a markdown.Markdown instance loads every extension, so it is
+    created once and reset between documents. Templates are compiled once
+    up front instead of being looked up for every page, and with a
+    template_cache_dir they are loaded precompiled (see
+    create_template_environment).
+    """
+
+    TEMPLATES = (
+        "xls.html",
+        "redirect.html",
+        "category.html",
+        "index.html",
+        "contribute.html",
+        "404.html",
+    )
+
+    def __init__(
+        self,
+        template_dir: Path,
+        base_url: str,
+        highlight_cache_dir: Path = None,
+        asset_names: Dict[str, str] = None,
+        profiler: BuildProfiler = None,
+        template_cache_dir: Path = None,
+    ):
+        self.highlight_cache = HighlightCache(highlight_cache_dir)
+
+        # Times each document's steps when the build is profiled
+        self.profiler = profiler or NullProfiler()
+
+        # Static asset name -> fingerprinted name, exposed to templates
+        self.asset_names = asset_names or {}
+
+        start = time.perf_counter()
+        self.template_cache_dir = template_cache_dir
+        self.env = create_template_environment(template_dir, template_cache_dir)
+        self.env.globals["assets"] = self.asset_names
+        self.templates = {name: self.env.get_template(name) for name in self.TEMPLATES}
+        self.template_setup_seconds = time.perf_counter() - start
+
+        self.md = create_markdown(self.highlight_cache, self.profiler)
+
+        self.base_url = base_url
+        self.conversions = 0
+
+    def reset_counters(self):
+        """Zero the conversion and highlight cache counters, so a renderer
+        reused across builds (watch mode) reports each build's own work."""
+        self.conversions = 0
+        self.highlight_cache.hits = 0
+        self.highlight_cache.misses = 0
+
+    def markdown_to_html(self, content: str) -> str:
+        """Convert markdown to HTML with the shared converter."""
+        self.conversions += 1
+        return convert_markdown_to_html(content, self.md, self.profiler)
+
+    def render(self, template_name: str, **context) -> str:
+        """Render one of the precompiled templates."""
+        return self.templates[template_name].render(**context)
+
+    def render_page_record(self, record: "PageRecord") -> "PageRecord":
+        """Render stage: fill in the record's HTML and search terms, and drop
+        its source. Terms are taken from the same Markdown conversion."""
+        profiler = self.profiler
+        try:
+            with profiler.span("render", "document", folder=record.doc.folder):
+                content_html = self.markdown_to_html(record.content)
+                with profiler.span("template"):
+                    record.html = self.render_xls_page(
+                        record.doc, content_html, record.required_by
+                    )
+                with profiler.span("terms"):
+                    record.terms = document_terms(
+                        record.doc.title, record.doc.description, content_html
+                    )
+        except Exception as e:
+            print(f"Error processing {record.doc.folder}: {e}")
+            raise
+        record.content = None
+        return record
+
+    def render_xls_page(self, doc, content_html: str, required_by: list) -> str:
+        """Render converted XLS content with the xls.html template."""
+        return self.render(
+            "xls.html",
+            doc=doc,
+            content=content_html,
+            required_by=required_by,
+            title=f"XLS-{doc.number}: {doc.title}",
+            base_url=".." if self.base_url == "." else self.base_url,
+        )
+
+
+# Per-process renderer for parallel builds, set up once by _init_render_worker
+_worker_renderer = None
+
+
+def _init_render_worker(
+    template_dir: Path,
+    base_url: str,
+    highlight_cache_dir: Optional[Path],
+    asset_names: Dict[str, str],
+    profile: Optional[dict] = None,
+    template_cache_dir: Optional[Path] = None,
+):
+    """Build the Jinja templates and Markdown converter once per worker.
+
+    ``profile`` holds BuildProfiler options when the build is profiled.
+    """
+    global _worker_renderer
+    _worker_renderer = SiteRenderer(
+        template_dir,
+        base_url,
+        highlight_cache_dir,
+        asset_names,
+        BuildProfiler(**profile) if profile is not None else None,
+        template_cache_dir,
+    )
+
+
+def _render_page_record_in_worker(record: "PageRecord") -> "PageRecord":
+    """Process pool entry point: render one page record."""
+    cache = _worker_renderer.highlight_cache
+    hits, misses = cache.hits, cache.misses
+    record = _worker_renderer.render_page_record(record)
+    # Report this page's highlight cache use to the main process
+    record.highlight_hits = cache.hits - hits
+    record.highlight_misses = cache.misses - misses
+    if _worker_renderer.profiler.enabled:
+        # Send this page's spans back to the profiler of the main process
+        record.spans = _worker_renderer.profiler.drain()
+    return record
+
+
+@dataclass
+class PageRecord:
+    """One XLS page flowing through the build pipeline.
+
+    The README content is loaded once, converted to HTML, and the record
+    is discarded after the page has been written.
+    """
+
+    doc: XLSDocument
+    output: str
+    required_by: List[XLSDocument]
+    key: str
+    content: Optional[str] = None
+    html: Optional[str] = None
+    terms: Optional[Dict[str, int]] = None
+    spans: Optional[List[dict]] = None
+    highlight_hits: int = 0
+    highlight_misses: int = 0
+
+
+def _load_page_records(
+    root_dir: Path,
+    site_dir: Path,
+    corpus: XLSCorpus,
+    dependency_graph,
+    manifest: "BuildManifest",
+    term_cache: SearchTermCache,
+    search_index: SearchIndexBuilder,
+    profiler=None,
+) -> Iterator[PageRecord]:
+    """Load stage: yield a record for every XLS page that must be rendered.
+
+    Pages whose inputs match the build manifest are skipped, and their
+    cached search terms go straight into the search index.
+    """
+    profiler = profiler or NullProfiler()
+    for doc in corpus.documents():
+        with profiler.span("read", folder=doc.folder):
+            try:
+                content = read_xls_content(root_dir, doc)
+            except Exception as e:
+                print(f"Error processing {doc.folder}: {e}")
+                raise
+
+            required_by = [
+                corpus.by_number(number)
+                for number in dependency_graph.dependents(doc.raw_number)
+            ]
+            output = f"xls/{doc.folder}.html"
+            key = _hash_inputs(
+                content, doc.to_dict(), [dep.folder for dep in required_by]
+            )
+        terms = term_cache.get(doc.folder, key)
+        if terms is not None and manifest.is_current(site_dir, output, key):
+            search_index.add(doc, terms)
+        else:
+            yield PageRecord(doc, output, required_by, key, content)
+
+
+def _bounded_map(executor, func, items, window: int) -> Iterator:
+    """Like executor.map, but submits at most ``window`` items ahead of the
+    consumer instead of the whole iterable at once. Results keep input order."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class BuildManifest:
+    """Records, for every generated file, a hash of the inputs it was built from.
+
+    Incremental builds skip any output whose recorded input hash is
+    unchanged. The whole manifest is ignored when the builder
+    configuration (templates, builder source, base URL, library versions)
+    changes, which forces a full rebuild.
+    """
+
+    def __init__(self, path: Path, config_hash: str):
+        self.path = path
+        self.config_hash = config_hash
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        self.rendered = 0
+        self.skipped = 0
+
+    def load(self) -> bool:
+        """Load the previous manifest; returns False if it is missing or stale."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("config") != self.config_hash:
+            return False
+        self.previous = data.get("outputs", {})
+        return True
+
+    def is_current(self, site_dir: Path, output: str, key: str) -> bool:
+        """Return True (and record the output) if it can be reused as-is."""
+        if self.previous.get(output) == key and (site_dir / output).exists():
+            self.current[output] = key
+            self.skipped += 1
+            return True
+        return False
+
+    def record(self, output: str, key: str):
+        """Record an output that was (re)generated in this build."""
+        self.current[output] = key
+        self.rendered += 1
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"config": self.config_hash, "outputs": self.current}, f)
+        os.replace(tmp_path, self.path)
+
+
+class SiteWriter:
+    """Writes site outputs into a new release and publishes it at the end.
+
+    Every output is compared with the file currently published at the same
+    path. Unchanged files are hard-linked from the live site instead of
+    rewritten, so they keep their mtime and deploy syncs skip them. The
+    site directory is a symlink to the published release, and it is only
+    repointed (with a single rename) once the whole build has succeeded,
+    so readers always see one complete release.
+    """
+
+    def __init__(self, site_dir: Path, releases_dir: Path):
+        self.site_dir = site_dir
+        self.releases_dir = releases_dir
+        self.deleted: List[str] = []
+        self._status: Dict[str, str] = {}
+
+        # Releases left over by interrupted builds are discarded
+        live_release = self._live_release()
+        if releases_dir.exists():
+            for path in releases_dir.iterdir():
+                if path.resolve() != live_release:
+                    shutil.rmtree(path, ignore_errors=True)
+        self.staging_dir = releases_dir / f"{time.time_ns():x}-{os.getpid()}"
+        self.staging_dir.mkdir(parents=True)
+
+    def _live_release(self) -> Optional[Path]:
+        if self.site_dir.is_symlink():
+            return self.site_dir.resolve()
+        return None
+
+    def write(self, output: str, data) -> bool:
+        """Stage an output (str or bytes), reusing the live file if identical.
+
+        HTML, CSS and JSON outputs also get a maximally compressed .gz
+        sibling, which is only regenerated when the output changed.
+        Returns True if the output changed.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if _has_content(self.site_dir / output, data):
+            self.keep(output)
+            return False
+        self._write_staged(output, data)
+        if output.endswith(PRECOMPRESSED_SUFFIXES):
+            self._write_staged(f"{output}.gz", _precompress(data))
+        return True
+
+    def keep(self, output: str):
+        """Stage the live copy of an output (and its .gz sibling) unchanged."""
+        self._link_live(output)
+        if output.endswith(PRECOMPRESSED_SUFFIXES):
+            compressed = f"{output}.gz"
+            if (self.site_dir / compressed).exists():
+                self._link_live(compressed)
+            else:
+                data = (self.site_dir / output).read_bytes()
+                self._write_staged(compressed, _precompress(data))
+
+    def _write_staged(self, output: str, data: bytes):
+        with open(self._prepare(output), "wb") as f:
+            f.write(data)
+        self._status[output] = "changed"
+
+    def _link_live(self, output: str):
+        live_path = self.site_dir / output
+        target = self._prepare(output)
+        try:
+            os.link(live_path, target)
+        except OSError:
+            # Filesystems without hard links: copy, keeping the mtime
+            shutil.copy2(live_path, target)
+        self._status[output] = "unchanged"
+
+    def _prepare(self, output: str) -> Path:
+        target = self.staging_dir / output
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Never write through a hard link into the live site
+        target.unlink(missing_ok=True)
+        return target
+
+    def commit(self, reused_outputs):
+        """Stage reused outputs, then publish the new release.
+
+        Args:
+            reused_outputs: Outputs that were not written in this build but
+                should be carried over from the live site (e.g. the pages an
+                incremental build skipped)
+        """
+        for output in reused_outputs:
+            if output not in self._status and (self.site_dir / output).exists():
+                self.keep(output)
+
+        if self.site_dir.exists():
+            self.deleted = sorted(
+                path.relative_to(self.site_dir).as_posix()
+                for path in self.site_dir.rglob("*")
+                if path.is_file()
+                and path.relative_to(self.site_dir).as_posix() not in self._status
+            )
+
+        previous_release = self._live_release()
+        if self.site_dir.is_dir() and previous_release is None:
+            # A plain _site directory from an older build cannot be swapped
+            # for a symlink atomically; it is removed once, here
+            shutil.rmtree(self.site_dir)
+
+        # Point a new symlink at the release, then rename it over the old one
+        link = self.site_dir.with_name(f".{self.site_dir.name}.{os.getpid()}.tmp")
+        link.unlink(missing_ok=True)
+        os.symlink(
+            os.path.relpath(self.staging_dir, self.site_dir.parent),
+            link,
+            target_is_directory=True,
+        )
+        os.replace(link, self.site_dir)
+
+        if previous_release is not None:
+            shutil.rmtree(previous_release, ignore_errors=True)
+
+    def outputs(self, status: str) -> List[str]:
+        """Return the sorted outputs staged with the given status."""
+        return sorted(o for o, s in self._status.items() if s == status)
+
+    def report(self) -> dict:
+        """Return the changed/unchanged/deleted summary of this build."""
+        return {
+            "changed": self.outputs("changed"),
+            "unchanged": self.outputs("unchanged"),
+            "deleted": self.deleted,
+        }
+
+    def save_report(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+
+
+def _precompress(data: bytes) -> bytes:
+    """Gzip data at maximum compression, reproducibly (no timestamp)."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Return True if the file at path exists and holds exactly data."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _hash_inputs(*parts) -> str:
+    """Return a hex digest over strings, bytes and JSON-serializable values."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        elif not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, default=str).encode("utf-8")
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _builder_config_hash(
+    template_dir: Path, base_url: str, asset_names: Dict[str, str]
+) -> str:
+    """Hash everything that affects every page: templates, builder code
+    (including the Markdown extension config), base URL, fingerprinted
+    asset names and the Markdown, Pygments and Jinja versions."""
+    parts = [
+        base_url,
+        asset_names,
+        markdown.__version__,
+        pygments.__version__ if pygments else None,
+        jinja2.__version__,
+        Path(__file__).read_bytes(),
+    ]
+    for path in sorted(template_dir.rglob("*")):
+        if path.is_file():
+            parts.extend([str(path.relative_to(template_dir)), path.read_bytes()])
+    return _hash_inputs(*parts)
+
+
+def fingerprint_assets(assets_dir: Path) -> Dict[str, str]:
+    """Map each static asset to a name containing a hash of its content.
+
+    For example "style.css" -> "style.3f2a9c1b0e.css". Fingerprinted
+    assets change URL whenever their content changes, so they can be
+    cached by browsers indefinitely.
+    """
+    asset_names = {}
+    if assets_dir.exists():
+        for path in sorted(assets_dir.iterdir()):
+            if path.is_file():
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                asset_names[path.name] = (
+                    f"{path.stem}.{digest[:ASSET_HASH_LENGTH]}{path.suffix}"
+                )
+    return asset_names
+
+
+def catalog_json(xls_docs: List[XLSDocument]) -> str:
+    """Return catalog.json: the table fields of every document, in order.
+
+    Rows are arrays in the order given by "fields" to keep the feed small.
+    """
+    fields = ["number", "folder", "title", "category", "status", "created", "authors"]
+    return json.dumps(
+        {
+            "version": 1,
+            "fields": fields,
+            "documents": [
+                [
+                    doc.number,
+                    doc.folder,
+                    doc.title,
+                    doc.category,
+                    doc.status,
+                    doc.created,
+                    [list(author) for author in doc.authors],
+                ]
+                for doc in xls_docs
+            ],
+        },
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def collect_redirects(xls_docs: List[XLSDocument]) -> Dict[str, str]:
+    """Return {alias path: canonical path} for every XLS number alias.
+
+    Paths are relative to the site root, e.g.
+    "xls/xls-33.html" -> "xls/XLS-0033-multi-purpose-tokens.html".
+    """
+    redirect_map = {}
+    for doc in sorted(xls_docs, key=lambda doc: doc.folder):
+        target = f"xls/{doc.folder}.html"
+        for alias in (f"xls-{doc.number}.html", f"xls-{doc.raw_number}.html"):
+            redirect_map[f"xls/{alias}"] = target
+    return redirect_map
+
+
+def _base_path(base_url: str) -> str:
+    """Return the URL path prefix the site is served under ("" at the root)."""
+    return urlparse(base_url).path.rstrip("/") if base_url != "." else ""
+
+
+def redirects_json(redirect_map: Dict[str, str]) -> str:
+    """Machine-readable redirect table (paths relative to the site root)."""
+    return json.dumps({"version": 1, "redirects": redirect_map}, indent=2) + "\n"
+
+
+def redirects_netlify(redirect_map: Dict[str, str], base_path: str) -> str:
+    """Redirect table in the _redirects format (Netlify, Cloudflare Pages)."""
+    lines = ["# XLS number aliases, generated by scripts/build_site.py"]
+    lines += [
+        f"{base_path}/{alias} {base_path}/{target} 301"
+        for alias, target in redirect_map.items()
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def redirects_nginx(redirect_map: Dict[str, str], base_path: str) -> str:
+    """Redirect table as an nginx map include.
+
+    Include it in the http block, then in the server block:
+        if ($xls_redirect) { return 301 $xls_redirect; }
+    """
+    lines = [
+        "# XLS number aliases, generated by scripts/build_site.py",
+        "map $uri $xls_redirect {",
+        '    default "";',
+    ]
+    lines += [
+        f"    {base_path}/{alias} {base_path}/{target};"
+        for alias, target in redirect_map.items()
+    ]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _site_base_url() -> str:
+    """Return the base URL for GitHub Pages, or "." for local builds.
+
+    Can be overridden with the GITHUB_PAGES_BASE_URL environment variable.
+    """
+    return (
         os.environ.get("GITHUB_PAGES_BASE_URL", "/XRPL-Standards")
         if "GITHUB_REPOSITORY" in os.environ
         else os.environ.get("GITHUB_PAGES_BASE_URL", ".")
     )
 
-    # Clean and create site directory
-    if site_dir.exists():
-        shutil.rmtree(site_dir)
-    site_dir.mkdir()
 
-    # Create subdirectories
-    (site_dir / "xls").mkdir()
-    (site_dir / "category").mkdir()  # New directory for category pages
-    (site_dir / "assets").mkdir()
+def build_site(
+    use_cache: bool = True,
+    incremental: bool = False,
+    jobs: int = 1,
+    changes_report: Path = None,
+    corpus: XLSCorpus = None,
+    renderer: SiteRenderer = None,
+    redirects: str = "pages",
+    profiler: BuildProfiler = None,
+    root_dir: Path = None,
+    site_dir: Path = None,
+):
+    """Main function to build the static site.
+
+    Args:
+        use_cache: Whether to reuse parsed metadata, precompiled templates
+            and highlighted code blocks from the on-disk caches
+        incremental: Reuse the existing _site and only regenerate outputs
+            whose inputs changed since the last build, as recorded in the
+            build manifest
+        jobs: Number of processes used to render XLS pages (None for one
+            per CPU). Output is identical to a serial build.
+        changes_report: Where to write the JSON list of changed, unchanged
+            and deleted outputs (default: .cache/site/changes.json)
+        corpus: Already loaded corpus to build from instead of loading one
+        renderer: SiteRenderer to reuse instead of creating one
+        redirects: How XLS number aliases are published (see REDIRECT_MODES):
+            "pages" writes a redirect HTML file per alias, "map" writes one
+            redirect table with _redirects, nginx and 404.html exporters,
+            and "both" does both
+        profiler: BuildProfiler recording each phase and document; its
+            report is left for the caller to save
+        root_dir: Directory holding the XLS-* folders, CONTRIBUTING.md and
+            the .cache directory (default: the repository root)
+        site_dir: Output directory (default: scripts/_site)
+    """
+    if redirects not in REDIRECT_MODES:
+        raise ValueError(f"Unknown redirect mode: {redirects}")
+    profiler = profiler or NullProfiler()
+    profiler.phase("setup")
+
+    # Setup directories
+    source_dir = Path(__file__).parent.resolve()
+    root_dir = root_dir or source_dir.parent
+    site_dir = site_dir or source_dir / "_site"
+    template_dir = source_dir / "templates"
+    assets_dir = source_dir / "assets"
+
+    # Set base URL for GitHub Pages (can be overridden with env var)
+    base_url = _site_base_url()
 
     # Setup Jinja2 environment
     if not template_dir.exists():
         raise FileNotFoundError(f"Templates directory not found: {template_dir}")
 
-    env = Environment(loader=FileSystemLoader(template_dir))
+    highlight_cache_dir = root_dir / HIGHLIGHT_CACHE_DIR if use_cache else None
+    if renderer is None:
+        renderer = SiteRenderer(
+            template_dir,
+            base_url,
+            highlight_cache_dir,
+            fingerprint_assets(assets_dir),
+            profiler if profiler.enabled else None,
+            root_dir / TEMPLATE_CACHE_DIR if use_cache else None,
+        )
+    renderer.reset_counters()
+    asset_names = renderer.asset_names
+
+    manifest = BuildManifest(
+        root_dir / BUILD_MANIFEST_PATH,
+        _builder_config_hash(template_dir, base_url, asset_names),
+    )
+    incremental = incremental and site_dir.exists() and manifest.load()
+
+    # Render into a new release; the live site is switched to it in one
+    # step at the end, and files whose content is unchanged keep their mtime
+    writer = SiteWriter(site_dir, root_dir / SITE_RELEASES_DIR)
 
     # Find and parse all XLS documents using the parser module
-    xls_docs = find_xls_documents(root_dir)
+    profiler.phase("load corpus")
+    if corpus is None:
+        corpus = XLSCorpus.load(root_dir, use_cache=use_cache)
+    xls_docs = corpus.documents()
+    dependency_graph = corpus.dependency_graph()
 
-    # Generate HTML for each document
-    for doc in xls_docs:
-        folder = root_dir / doc.folder
-        readme_path = folder / "README.md"
+    # Stream every XLS page through load -> render -> write. Metadata
+    # for the whole corpus is already known (from the preamble or the
+    # metadata cache), so each README body is read exactly once here and
+    # dropped as soon as its page has been written.
+    profiler.phase("pages")
+    term_cache = SearchTermCache(root_dir / SEARCH_TERMS_PATH)
+    search_index = SearchIndexBuilder()
+    records = _load_page_records(
+        root_dir,
+        site_dir,
+        corpus,
+        dependency_graph,
+        manifest,
+        term_cache,
+        search_index,
+        profiler,
+    )
 
-        try:
-            with open(readme_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Convert to HTML
-            html_content = convert_markdown_to_html(content)
-
-            # Render XLS page
-            xls_template = env.get_template("xls.html")
-            rendered_html = xls_template.render(
-                doc=doc,
-                content=html_content,
-                title=f"XLS-{doc.number}: {doc.title}",
-                base_url=".." if base_url == "." else base_url,
-            )
+    executor = None
+    if jobs is None or jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_render_worker,
+            initargs=(
+                template_dir,
+                base_url,
+                highlight_cache_dir,
+                renderer.asset_names,
+                {"trace_memory": profiler.trace_memory} if profiler.enabled else None,
+                renderer.template_cache_dir,
+            ),
+        )
+        # Keep a bounded number of records in flight so memory stays flat
+        rendered = _bounded_map(
+            executor,
+            _render_page_record_in_worker,
+            records,
+            window=4 * (jobs or os.cpu_count() or 1),
+        )
+    else:
+        rendered = map(renderer.render_page_record, records)
 
+    # Pages rendered by worker processes, which count their own conversions
+    # and highlight cache use
+    worker_conversions = 0
+    worker_highlight = Counter()
+    try:
+        for record in rendered:
+            if executor:
+                worker_conversions += 1
+                worker_highlight["hits"] += record.highlight_hits
+                worker_highlight["misses"] += record.highlight_misses
+            if record.spans:
+                profiler.extend(record.spans)
             # Write XLS HTML file
-            output_path = site_dir / "xls" / f"{doc.folder}.html"
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(rendered_html)
+            with profiler.span("write", folder=record.doc.folder):
+                changed = writer.write(record.output, record.html)
+            manifest.record(record.output, record.key)
+            search_index.add(record.doc, record.terms)
+            term_cache.store(record.doc.folder, record.key, record.terms)
 
-            print(f"Generated: {output_path}")
+            if changed:
+                print(f"Generated: {site_dir / record.output}")
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+    renderer.highlight_cache.prune()
 
-        except Exception as e:
-            print(f"Error processing {doc.folder}: {e}")
-            raise
+    # Write the sharded full-text search index. It is cheap to assemble from
+    # the per-page terms, so it is regenerated on every build; the writer
+    # leaves unchanged shards untouched.
+    profiler.phase("search index")
+    for name, data in search_index.files().items():
+        writer.write(f"search/{name}", data)
 
     # Sort documents by number in reverse order (later ones more relevant)
+    profiler.phase("redirects")
     xls_docs.sort(key=lambda x: int(x.number), reverse=True)
 
     # Generate simple redirect pages so /xls-<number>.html redirects to
     # the canonical document URL under /xls/<folder>.html.
-    redirect_template = env.get_template("redirect.html")
-    for doc in xls_docs:
-        # Redirect pages live under /xls/, next to the canonical XLS HTML files.
-        # For local builds (base_url == "."), use a relative URL that does *not*
-        # add another /xls/ segment; otherwise we create /xls/xls/<file>.html.
-        if base_url == ".":
-            # From scripts/_site/xls/xls-<number>.html → ./<folder>.html
-            target_url = f"./{doc.folder}.html"
-        else:
-            # On GitHub Pages, use an absolute URL with the base path.
-            target_url = f"{base_url}/xls/{doc.folder}.html"
+    if redirects in ("pages", "both"):
+        for doc in xls_docs:
+            # Redirect pages live under /xls/, next to the canonical XLS HTML files.
+            # For local builds (base_url == "."), use a relative URL that does *not*
+            # add another /xls/ segment; otherwise we create /xls/xls/<file>.html.
+            if base_url == ".":
+                # From scripts/_site/xls/xls-<number>.html → ./<folder>.html
+                target_url = f"./{doc.folder}.html"
+            else:
+                # On GitHub Pages, use an absolute URL with the base path.
+                target_url = f"{base_url}/xls/{doc.folder}.html"
 
-        redirect_html = redirect_template.render(
-            title=f"XLS-{doc.number}: {doc.title}",
-            target_url=target_url,
-        )
+            title = f"XLS-{doc.number}: {doc.title}"
+            key = _hash_inputs(title, target_url)
+            redirect_html = None
+
+            # /xls/ alias: /xls/xls-<number>.html
+            aliases = (f"xls-{doc.number}.html", f"xls-{doc.raw_number}.html")
+            for redirect_url in aliases:
+                output = f"xls/{redirect_url}"
+                if manifest.is_current(site_dir, output, key):
+                    continue
+                if redirect_html is None:
+                    redirect_html = renderer.render(
+                        "redirect.html",
+                        title=title,
+                        target_url=target_url,
+                    )
 
-        # /xls/ alias: /xls/xls-<number>.html
-        def add_redirect(redirect_url, target_url):
-            redirect_xls_path = site_dir / "xls" / redirect_url
-            with open(redirect_xls_path, "w", encoding="utf-8") as f:
-                f.write(redirect_html)
+                redirect_xls_path = site_dir / output
+                changed = writer.write(output, redirect_html)
+                manifest.record(output, key)
 
-            print(f"Generated redirect: {redirect_xls_path} -> {target_url}")
+                if changed:
+                    print(f"Generated redirect: {redirect_xls_path} -> {target_url}")
 
-        add_redirect(f"xls-{doc.number}.html", target_url)
-        add_redirect(f"xls-{doc.raw_number}.html", target_url)
+    # Or publish the same aliases as one redirect table for servers
+    if redirects in ("map", "both"):
+        redirect_map = collect_redirects(xls_docs)
+        base_path = _base_path(base_url)
+        changed = writer.write("redirects.json", redirects_json(redirect_map))
+        changed |= writer.write(
+            "_redirects", redirects_netlify(redirect_map, base_path)
+        )
+        changed |= writer.write(
+            "redirects.nginx.conf", redirects_nginx(redirect_map, base_path)
+        )
+        changed |= writer.write(
+            "404.html",
+            renderer.render(
+                "404.html",
+                title="Page not found",
+                redirects=redirect_map,
+                base_url=base_url,
+            ),
+        )
+        if changed:
+            print(
+                f"Generated redirect map: {len(redirect_map)} aliases "
+                f"(redirects.json, _redirects, redirects.nginx.conf, 404.html)"
+            )
 
     # Group documents by category for category pages and navigation
-    categories = {}
-    for doc in xls_docs:
-        category = doc.category
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(doc)
+    profiler.phase("index pages")
+    categories = corpus.categories()
+
+    # Index and category pages only depend on preamble metadata
+    metadata_key = _hash_inputs([doc.to_dict() for doc in xls_docs])
 
     # Generate category pages
-    category_template = env.get_template("category.html")
     all_categories = [(cat, len(docs)) for cat, docs in sorted(categories.items())]
 
     for category, category_docs in categories.items():
+        output = f"category/{category.lower()}.html"
+        if manifest.is_current(site_dir, output, metadata_key):
+            continue
+
         # Sort category documents by number in reverse order
         category_docs.sort(key=lambda x: int(x.number), reverse=True)
 
-        category_html = category_template.render(
+        category_html = renderer.render(
+            "category.html",
             title=f"{category} XLS Standards",
             category=category,
             category_docs=category_docs,
             all_categories=all_categories,
             total_count=len(xls_docs),
+            page_size=CATALOG_PAGE_SIZE,
             base_url=".." if base_url == "." else base_url,
         )
 
         # Write category HTML file
-        category_file = site_dir / "category" / f"{category.lower()}.html"
-        with open(category_file, "w", encoding="utf-8") as f:
-            f.write(category_html)
+        category_file = site_dir / output
+        changed = writer.write(output, category_html)
+        manifest.record(output, metadata_key)
 
-        print(f"Generated category page: {category_file}")
+        if changed:
+            print(f"Generated category page: {category_file}")
 
     # Generate index page with category navigation
-    index_template = env.get_template("index.html")
-    index_html = index_template.render(
-        title="XRP Ledger Standards (XLS)",
-        total_count=len(xls_docs),
-        xls_docs=xls_docs,
-        all_categories=all_categories,
-        base_url=base_url,
-    )
+    if not manifest.is_current(site_dir, "index.html", metadata_key):
+        index_html = renderer.render(
+            "index.html",
+            title="XRP Ledger Standards (XLS)",
+            total_count=len(xls_docs),
+            xls_docs=xls_docs,
+            all_categories=all_categories,
+            page_size=CATALOG_PAGE_SIZE,
+            base_url=base_url,
+        )
 
-    # Write index file
-    with open(site_dir / "index.html", "w", encoding="utf-8") as f:
-        f.write(index_html)
+        # Write index file
+        writer.write("index.html", index_html)
+        manifest.record("index.html", metadata_key)
+
+    # Catalog feed used for sorting and paging the index and category tables
+    writer.write("catalog.json", catalog_json(xls_docs))
 
     # Generate contribute page from CONTRIBUTING.md
+    profiler.phase("contribute page")
     contributing_path = root_dir / "CONTRIBUTING.md"
     if contributing_path.exists():
         try:
             with open(contributing_path, "r", encoding="utf-8") as f:
                 contributing_content = f.read()
 
-            # Convert markdown to HTML
-            contributing_html_content = convert_markdown_to_html(contributing_content)
+            key = _hash_inputs(contributing_content)
+            if not manifest.is_current(site_dir, "contribute.html", key):
+                # Convert markdown to HTML
+                contributing_html_content = renderer.markdown_to_html(
+                    contributing_content
+                )
 
-            # Render contribute page
-            contribute_template = env.get_template("contribute.html")
-            contribute_html = contribute_template.render(
-                title="Contributing to XLS Standards",
-                content=contributing_html_content,
-                base_url=base_url,
-            )
+                # Render contribute page
+                contribute_html = renderer.render(
+                    "contribute.html",
+                    title="Contributing to XLS Standards",
+                    content=contributing_html_content,
+                    base_url=base_url,
+                )
 
-            # Write contribute file
-            with open(site_dir / "contribute.html", "w", encoding="utf-8") as f:
-                f.write(contribute_html)
+                # Write contribute file
+                changed = writer.write("contribute.html", contribute_html)
+                manifest.record("contribute.html", key)
 
-            print(f"Generated contribute page from CONTRIBUTING.md")
+                if changed:
+                    print(f"Generated contribute page from CONTRIBUTING.md")
 
         except Exception as e:
             print(f"Error generating contribute page: {e}")
@@ -251,22 +1437,70 @@ def build_site():
         print("Warning: CONTRIBUTING.md not found")
 
     # Copy CSS file
+    profiler.phase("assets")
     css_source = assets_dir / "style.css"
-    css_dest = site_dir / "assets" / "style.css"
     if css_source.exists():
-        shutil.copy2(css_source, css_dest)
+        _copy_asset(
+            writer, manifest, css_source, f"assets/{asset_names['style.css']}"
+        )
     else:
         raise FileNotFoundError(f"CSS file not found: {css_source}")
 
     # Copy favicon
     favicon_source = assets_dir / "favicon.ico"
-    favicon_dest = site_dir / "assets" / "favicon.ico"
     if favicon_source.exists():
-        shutil.copy2(favicon_source, favicon_dest)
+        _copy_asset(
+            writer, manifest, favicon_source, f"assets/{asset_names['favicon.ico']}"
+        )
     else:
         print(f"Warning: Favicon not found: {favicon_source}")
 
+    # Copy the client-side scripts
+    for script in ("search.js", "catalog.js"):
+        script_source = assets_dir / script
+        if script_source.exists():
+            _copy_asset(
+                writer, manifest, script_source, f"assets/{asset_names[script]}"
+            )
+        else:
+            print(f"Warning: Script not found: {script_source}")
+
+    # Swap the staged site in. Outputs whose source no longer exists (e.g.
+    # deleted XLS folders) are simply not carried over.
+    profiler.phase("commit")
+    writer.commit(manifest.current)
+    for output in writer.deleted:
+        print(f"Removed stale output: {site_dir / output}")
+
+    manifest.save()
+    term_cache.save()
+    changes_report = changes_report or root_dir / BUILD_CHANGES_PATH
+    writer.save_report(changes_report)
+    profiler.phase(None)
+
+    if incremental:
+        print(
+            f"Incremental build: {manifest.rendered} output(s) regenerated, "
+            f"{manifest.skipped} unchanged."
+        )
     print(f"Site built successfully! Generated {len(xls_docs)} XLS documents.")
+    print(
+        f"Output: {len(writer.outputs('changed'))} changed, "
+        f"{len(writer.outputs('unchanged'))} unchanged, "
+        f"{len(writer.deleted)} deleted (report: {changes_report})"
+    )
+    conversions = renderer.conversions + worker_conversions
+    if conversions:
+        print(
+            f"Renderer: {conversions} Markdown conversion(s) on one reused "
+            f"pipeline per process (templates loaded once in "
+            f"{renderer.template_setup_seconds:.3f}s)."
+        )
+        highlight_cache = renderer.highlight_cache
+        print(
+            f"Highlight cache: {highlight_cache.hits + worker_highlight['hits']} "
+            f"hit(s), {highlight_cache.misses + worker_highlight['misses']} miss(es)"
+        )
 
     # Count by status for reporting
     # Count documents by status (case-insensitive, no hardcoding)
@@ -278,5 +1512,245 @@ def build_site():
         print(f"- {status.capitalize()}: {count}")
 
 
+def _copy_asset(writer: SiteWriter, manifest: BuildManifest, source: Path, output: str):
+    """Copy a static asset into the site unless it is unchanged."""
+    data = source.read_bytes()
+    key = _hash_inputs(data)
+    if manifest.is_current(writer.site_dir, output, key):
+        return
+    writer.write(output, data)
+    manifest.record(output, key)
+
+
+def _watch_snapshot(root_dir: Path, source_dir: Path) -> Dict[Path, tuple]:
+    """Return (mtime, size) for every file that watch mode rebuilds on."""
+    paths = [
+        *root_dir.glob("XLS-*/README.md"),
+        root_dir / "CONTRIBUTING.md",
+        *(source_dir / "templates").glob("*"),
+        *(source_dir / "assets").glob("*"),
+    ]
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _serve_site(site_dir: Path, port: int):
+    """Serve the site over HTTP from a background thread."""
+    import functools
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    # The handler resolves paths per request, so it keeps working after
+    # each rebuild points _site at a new release
+    handler = functools.partial(QuietHandler, directory=str(site_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def watch_site(
+    port: int = 8000,
+    use_cache: bool = True,
+    jobs: int = 1,
+    changes_report: Path = None,
+    redirects: str = "pages",
+):
+    """Build the site, serve it locally and rebuild it whenever sources change.
+
+    The parsed corpus, Markdown pipeline and templates stay in memory
+    between rebuilds. Each rebuild is incremental: only pages whose inputs
+    changed are rendered, plus the index and category pages when preamble
+    metadata changed. Templates are recompiled, and assets fingerprinted
+    again, when a template or asset changes.
+    """
+    source_dir = Path(__file__).parent.resolve()
+    root_dir = source_dir.parent
+    template_dir = source_dir / "templates"
+    assets_dir = source_dir / "assets"
+    base_url = _site_base_url()
+    highlight_cache_dir = root_dir / HIGHLIGHT_CACHE_DIR if use_cache else None
+    template_cache_dir = root_dir / TEMPLATE_CACHE_DIR if use_cache else None
+
+    def create_renderer() -> SiteRenderer:
+        return SiteRenderer(
+            template_dir,
+            base_url,
+            highlight_cache_dir,
+            fingerprint_assets(assets_dir),
+            template_cache_dir=template_cache_dir,
+        )
+
+    corpus = XLSCorpus.load(root_dir, use_cache=use_cache)
+    renderer = create_renderer()
+    snapshot = _watch_snapshot(root_dir, source_dir)
+    build_site(
+        use_cache,
+        True,
+        jobs,
+        changes_report,
+        corpus=corpus,
+        renderer=renderer,
+        redirects=redirects,
+    )
+
+    server = _serve_site(source_dir / "_site", port)
+    print(f"\nServing site at http://127.0.0.1:{port}/ - watching for changes")
+    print("Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(WATCH_POLL_SECONDS)
+            current = _watch_snapshot(root_dir, source_dir)
+            changed = sorted(
+                path
+                for path in current.keys() | snapshot.keys()
+                if current.get(path) != snapshot.get(path)
+            )
+            if not changed:
+                continue
+            snapshot = current
+
+            names = ", ".join(str(path.relative_to(root_dir)) for path in changed)
+            print(f"\nChanged: {names}")
+            start = time.perf_counter()
+            try:
+                corpus.refresh()
+                if any(path.parent in (template_dir, assets_dir) for path in changed):
+                    renderer = create_renderer()
+                build_site(
+                    use_cache,
+                    True,
+                    1,
+                    changes_report,
+                    corpus=corpus,
+                    renderer=renderer,
+                    redirects=redirects,
+                )
+            except Exception as e:
+                # The live site is only replaced by a successful build
+                print(f"Rebuild failed: {e}")
+            else:
+                print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopping watch mode.")
+    finally:
+        server.shutdown()
+
+
+def main():
+    """Command-line entry point for the site builder."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the XLS Standards site")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk metadata, template and syntax highlighting caches",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only regenerate pages whose inputs changed since the last build",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=None,
+        default=1,
+        metavar="N",
+        help="Render pages on N processes (one per CPU if N is omitted)",
+    )
+    parser.add_argument(
+        "--changes-report",
+        type=Path,
+        metavar="PATH",
+        help=f"Write the changed/unchanged/deleted output lists here "
+        f"(default: {BUILD_CHANGES_PATH})",
+    )
+    parser.add_argument(
+        "--redirects",
+        choices=REDIRECT_MODES,
+        default="pages",
+        help="Publish XLS number aliases as redirect pages (default), as one "
+        "redirect map with _redirects/nginx/404.html exporters, or both",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=PROFILE_DIR,
+        metavar="DIR",
+        help=f"Record wall/CPU time and memory per phase and document, and "
+        f"write profile.json and trace.json to DIR (default: {PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of slowest documents to print with --profile (default: 10)",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="With --profile, skip tracemalloc: it slows the build several "
+        "times over, so use this when only timings matter",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Serve the site locally and rebuild changed pages on every edit",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port for the --watch HTTP server (default: 8000)",
+    )
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_site(
+            port=args.port,
+            use_cache=not args.no_cache,
+            jobs=args.jobs,
+            changes_report=args.changes_report,
+            redirects=args.redirects,
+        )
+        return
+
+    profiler = None
+    if args.profile:
+        profiler = BuildProfiler(trace_memory=not args.no_trace_memory)
+
+    build_site(
+        use_cache=not args.no_cache,
+        incremental=args.incremental,
+        jobs=args.jobs,
+        changes_report=args.changes_report,
+        redirects=args.redirects,
+        profiler=profiler,
+    )
+
+    if profiler:
+        profiler.finish()
+        profiler.print_summary(args.profile_top)
+        root_dir = Path(__file__).parent.resolve().parent
+        paths = profiler.save(root_dir / args.profile)
+        print(f"\nProfile: {paths['profile']}")
+        print(f"Trace (chrome://tracing, ui.perfetto.dev): {paths['trace']}")
+
+
 if __name__ == "__main__":
-    build_site()
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Search index builder for the XLS Standards static site.
+
+Builds a compact inverted index over XLS titles, descriptions, section
+headings and body text. The index is split into JSON shards by term
+prefix, so the browser-side query script (assets/search.js) only
+downloads the shards for the words being searched.
+
+Published layout (under _site/search/):
+    index.json    Documents by ID, shard list and tokenizer settings
+    <prefix>.json Postings for every term starting with <prefix>
+
+Documents are identified by their XLS number ("0033"), so adding or
+removing one spec only changes the shards of the terms it contains.
+
+Usage:
+    # Query the index of a built site
+    python scripts/search_index.py "vault deposit"
+"""
+
+import html
+import json
+import math
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Bump when the index format or tokenizer changes
+SEARCH_INDEX_VERSION = 2
+
+# Terms are grouped into shards by this many leading characters
+SHARD_PREFIX_LENGTH = 2
+
+MIN_TERM_LENGTH = 2
+
+# Relative weight of a term occurrence in each field
+FIELD_WEIGHTS = {"title": 10, "description": 5, "heading": 3, "body": 1}
+
+# Common words that would match nearly every document. Shipped in
+# index.json so that the query script skips the same words.
+STOPWORDS = frozenset(
+    "an and are as at be by can for from has have if in is it its may must "
+    "not of on or should that the this to was were which will with".split()
+)
+
+_TERM_RE = re.compile(r"[a-z0-9]+")
+_HEADING_RE = re.compile(r"<h[1-6][^>]*>(.*?)</h[1-6]>", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+# TOC permalink markers added by the Markdown toc extension
+_PERMALINK_RE = re.compile(r'<a class="headerlink"[^>]*>.*?</a>', re.DOTALL)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms, dropping stopwords."""
+    return [
+        term
+        for term in _TERM_RE.findall(text.lower())
+        if len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS
+    ]
+
+
+def _html_text(fragment: str) -> str:
+    return html.unescape(_TAG_RE.sub(" ", fragment))
+
+
+def document_terms(title: str, description: str, content_html: str) -> Dict[str, int]:
+    """Score every term of one document.
+
+    Args:
+        title: Document title from the preamble
+        description: Document description from the preamble
+        content_html: The document body rendered from Markdown
+
+    Returns:
+        Mapping of term to an integer relevance score
+    """
+    content_html = _PERMALINK_RE.sub("", content_html)
+    fields = {
+        "title": title,
+        "description": description,
+        "heading": " ".join(_html_text(h) for h in _HEADING_RE.findall(content_html)),
+        "body": _html_text(content_html),
+    }
+
+    scores: Dict[str, float] = {}
+    for field, text in fields.items():
+        counts: Dict[str, int] = {}
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0) + 1
+        weight = FIELD_WEIGHTS[field]
+        for term, count in counts.items():
+            # Dampen repetition so long specs do not dominate every query
+            scores[term] = scores.get(term, 0) + weight * (1 + math.log(count))
+    return {term: max(1, round(score)) for term, score in scores.items()}
+
+
+class SearchIndexBuilder:
+    """Collects per-document terms and produces the sharded index files."""
+
+    def __init__(self):
+        # Folder -> (XLS number, index entry, terms)
+        self._documents: Dict[str, Tuple[str, list, Dict[str, int]]] = {}
+
+    def add(self, doc, terms: Dict[str, int]):
+        """Add a document (an XLSDocument) with its scored terms."""
+        entry = [
+            f"xls/{doc.folder}.html",
+            f"XLS-{doc.number}: {doc.title}",
+            doc.description,
+        ]
+        self._documents[doc.folder] = (doc.number, entry, terms)
+
+    def _document_ids(self) -> Dict[str, str]:
+        """Map each folder to its document ID: the XLS number, or the folder
+        itself when an earlier folder already uses the number."""
+        ids = {}
+        used = set()
+        for folder in sorted(self._documents):
+            number = self._documents[folder][0]
+            ids[folder] = folder if number in used else number
+            used.add(number)
+        return ids
+
+    def files(self) -> Dict[str, str]:
+        """Return the index as {path under search/: JSON text}."""
+        ids = self._document_ids()
+
+        shards: Dict[str, Dict[str, list]] = {}
+        for folder in sorted(self._documents):
+            for term, score in self._documents[folder][2].items():
+                shard = shards.setdefault(term[:SHARD_PREFIX_LENGTH], {})
+                shard.setdefault(term, []).append([ids[folder], score])
+
+        files = {
+            f"{prefix}.json": _dump(
+                {term: shard[term] for term in sorted(shard)}
+            )
+            for prefix, shard in shards.items()
+        }
+        files["index.json"] = _dump(
+            {
+                "version": SEARCH_INDEX_VERSION,
+                "prefix_length": SHARD_PREFIX_LENGTH,
+                "min_term_length": MIN_TERM_LENGTH,
+                "stopwords": sorted(STOPWORDS),
+                "shards": sorted(shards),
+                # Document ID -> [url, title, description]
+                "documents": {
+                    ids[folder]: self._documents[folder][1]
+                    for folder in sorted(self._documents)
+                },
+            }
+        )
+        return files
+
+
+def _dump(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+class SearchTermCache:
+    """On-disk store of each page's scored terms, keyed by its build key.
+
+    Incremental builds skip rendering unchanged pages, so their terms are
+    taken from here instead of being tokenized again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, dict] = {}
+        self._current: Dict[str, dict] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == SEARCH_INDEX_VERSION:
+            self._entries = data.get("entries", {})
+
+    def get(self, folder: str, key: str) -> Optional[Dict[str, int]]:
+        """Return cached terms for a page built from the given inputs."""
+        entry = self._entries.get(folder)
+        if entry and entry["key"] == key:
+            self._current[folder] = entry
+            return entry["terms"]
+        return None
+
+    def store(self, folder: str, key: str, terms: Dict[str, int]):
+        self._current[folder] = {"key": key, "terms": terms}
+
+    def save(self):
+        """Write the entries used by this build, dropping all others."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SEARCH_INDEX_VERSION, "entries": self._current}, f)
+        tmp_path.replace(self.path)
+
+
+def search(load, query: str, limit: int = 10) -> List[list]:
+    """Run a query against a built index.
+
+    Mirrors the ranking of assets/search.js: every word must match, and the
+    last word also matches as a prefix, so partially typed words work.
+
+    Args:
+        load: Function returning the JSON text of an index file by name
+            (e.g. "index.json"), or None if it does not exist
+        query: Free-text query
+        limit: Maximum number of results
+
+    Returns:
+        Matching [url, title, description] entries, best first
+    """
+    index = json.loads(load("index.json"))
+    words = tokenize(query)
+    if not words:
+        return []
+    totals: Optional[Dict[str, int]] = None
+    for position, word in enumerate(words):
+        shard = json.loads(load(f"{word[: index['prefix_length']]}.json") or "{}")
+        is_last = position == len(words) - 1
+        matches: Dict[str, int] = {}
+        for term, postings in shard.items():
+            if term == word or (is_last and term.startswith(word)):
+                for doc_id, score in postings:
+                    matches[doc_id] = max(matches.get(doc_id, 0), score)
+        if totals is None:
+            totals = matches
+        else:
+            totals = {
+                doc_id: total + matches[doc_id]
+                for doc_id, total in totals.items()
+                if doc_id in matches
+            }
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    return [index["documents"][doc_id] for doc_id, _ in ranked[:limit]]
+
+
+def main():
+    """Query the search index of a built site from the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Search the built XLS site")
+    parser.add_argument("query", help="Words to search for")
+    parser.add_argument(
+        "--site",
+        type=Path,
+        default=Path(__file__).parent.resolve() / "_site",
+        help="Built site directory (default: scripts/_site)",
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results")
+    args = parser.parse_args()
+
+    search_dir = args.site / "search"
+    if not (search_dir / "index.json").exists():
+        print(f"No search index in {search_dir}; run build_site.py first")
+        return 1
+
+    def load(name: str) -> Optional[str]:
+        path = search_dir / name
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    for url, title, description in search(load, args.query, args.limit):
+        print(f"{title}\n    {url}\n    {description}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Synthetic XLS corpus generator for benchmarks.
+
+Creates any number of realistic XLS folders built from
+templates/XLS_TEMPLATE.md, with templates/AMENDMENT_TEMPLATE.md used as the
+specification section of Amendment-category documents. Output is
+deterministic for a given count and seed.
+
+Usage:
+    python scripts/synthetic_corpus.py /tmp/xls-corpus --count 1000
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+from xls_parser import VALID_CATEGORIES, VALID_STATUSES
+
+TEMPLATES_DIR = Path(__file__).parent.resolve().parent / "templates"
+
+_WORDS = (
+    "ledger token escrow vault oracle amendment account offer payment "
+    "trust line domain credential bridge clawback fee reserve issuer "
+    "holder transfer ticket signer batch hook metadata hash sequence"
+).split()
+
+_FIRST_NAMES = ["Alice", "Bob", "Carol", "Dave", "Erin", "Frank", "Grace"]
+_LAST_NAMES = ["Nakamoto", "Lovelace", "Hopper", "Turing", "Shannon", "Knuth"]
+
+
+def _template_body(name: str) -> str:
+    """Return a template's content after its preamble (if any)."""
+    content = (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+    end = content.find("</pre>")
+    return content[end + len("</pre>"):] if end >= 0 else content
+
+
+def _phrase(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(count))
+
+
+def _preamble(rng: random.Random, number: int, category: str, status: str) -> str:
+    """Build a preamble block with every field the parser understands."""
+    authors = []
+    for _ in range(rng.randint(1, 3)):
+        first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+        if rng.random() < 0.5:
+            authors.append(f"{first} {last} (@{first.lower()}{last.lower()})")
+        else:
+            authors.append(f"{first} {last} <{first.lower()}@example.com>")
+
+    year = rng.randint(2018, 2025)
+    created = f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    lines = [
+        f"  xls: {number}",
+        f"  title: {_phrase(rng, 4).title()}",
+        f"  description: A synthetic specification about {_phrase(rng, 8)}",
+        f"  author: {', '.join(authors)}",
+        f"  category: {category}",
+        f"  status: {status}",
+        "  proposal-from: "
+        f"https://github.com/XRPLF/XRPL-Standards/discussions/{1000 + number}",
+        f"  created: {created}",
+    ]
+    if number > 1 and rng.random() < 0.3:
+        required = sorted(rng.sample(range(1, number), min(2, number - 1)))
+        lines.append("  requires: " + ", ".join(f"XLS-{n}" for n in required))
+    if rng.random() < 0.5:
+        lines.append(f"  updated: {year + 1}-{rng.randint(1, 12):02d}-01")
+    if category in ("Amendment", "System") and rng.random() < 0.5:
+        lines.append(
+            f"  implementation: https://github.com/XRPLF/rippled/pull/{number}"
+        )
+    if status == "Withdrawn":
+        lines.append("  withdrawal-reason: Superseded by a later synthetic spec")
+    return "<pre>\n" + "\n".join(lines) + "\n</pre>\n"
+
+
+def generate_document(number: int, seed: int = 0) -> str:
+    """Return the README content of synthetic XLS ``number``."""
+    rng = random.Random(seed * 1_000_003 + number)
+    category = VALID_CATEGORIES[number % len(VALID_CATEGORIES)]
+    status = VALID_STATUSES[rng.randrange(len(VALID_STATUSES))]
+
+    body = _template_body("XLS_TEMPLATE.md")
+    if category == "Amendment":
+        # Replace the generic specification guidance with the full
+        # Amendment template, as real Amendment specs do.
+        body = re.sub(
+            r"(## 3\. Specification\n)",
+            lambda m: m.group(1) + _template_body("AMENDMENT_TEMPLATE.md"),
+            body,
+            count=1,
+        )
+    body = body.replace("[Title]", f"Synthetic XLS-{number}")
+    # Currency-like amounts and inline math exercise the math converter
+    body += (
+        f"\nThe reserve is $2 per object and $10 total; "
+        f"the fee is $f = {number} \\cdot r$ drops.\n"
+    )
+    return _preamble(rng, number, category, status) + body
+
+
+def generate_corpus(dest: Path, count: int, seed: int = 0) -> List[Path]:
+    """Write ``count`` synthetic XLS folders under ``dest``.
+
+    Args:
+        dest: Directory to create the XLS-* folders in
+        count: Number of documents to generate
+        seed: Seed for the deterministic random content
+
+    Returns:
+        List of generated README paths
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for number in range(1, count + 1):
+        folder = dest / f"XLS-{number:04d}-synthetic-{number}"
+        folder.mkdir(exist_ok=True)
+        readme = folder / "README.md"
+        readme.write_text(generate_document(number, seed), encoding="utf-8")
+        paths.append(readme)
+    return paths
+
+
+def main():
+    """Command-line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic XLS corpus")
+    parser.add_argument("dest", type=Path, help="Directory to write folders to")
+    parser.add_argument(
+        "--count", type=int, default=100, help="Number of documents (default: 100)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.dest, args.count, args.seed)
+    print(f"Generated {len(paths)} XLS documents in {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,7 +34,7 @@ import urllib.request
 import urllib.error
 
 from markdown_it import MarkdownIt
-from xls_parser import extract_xls_metadata, validate_xls_preamble
+from xls_parser import check_xls_preamble, extract_xls_metadata
 
 
 @dataclass
@@ -239,16 +239,9 @@ class XLSTemplateValidator:
 
     def _validate_preamble(self, doc):
         """Validate preamble metadata fields using the parser's validation."""
-        preamble_errors = validate_xls_preamble(doc)
-        for error_msg in preamble_errors:
-            # Strip the folder prefix since we use file_path
-            # Error format is "folder: message", extract just the message
-            if ": " in error_msg:
-                message = error_msg.split(": ", 1)[1]
-            else:
-                message = error_msg
+        for issue in check_xls_preamble(doc):
             self.errors.append(ValidationError(
-                str(self.file_path), 1, message
+                str(self.file_path), 1, issue.message
             ))
 
     def _validate_section_structure(self):
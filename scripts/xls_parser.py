@@ -6,37 +6,132 @@ This module provides functionality to parse XLS (XRPL Standards) documents
 and extract their metadata for use in documentation systems and validation.
 """
 
+import hashlib
+import heapq
+import json
+import os
 import re
-from dataclasses import asdict, dataclass
+from bisect import insort
+from collections import deque
+from itertools import chain, compress
+from operator import attrgetter, lt
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import sys
 
 from bs4 import BeautifulSoup
 
 
+class XLSStatus(StrEnum):
+    """Valid status values for XLS documents."""
+
+    DRAFT = "Draft"
+    FINAL = "Final"
+    LIVING = "Living"
+    DEPRECATED = "Deprecated"
+    STAGNANT = "Stagnant"
+    WITHDRAWN = "Withdrawn"
+
+
+class XLSCategory(StrEnum):
+    """Valid category values for XLS documents."""
+
+    AMENDMENT = "Amendment"
+    SYSTEM = "System"
+    ECOSYSTEM = "Ecosystem"
+    META = "Meta"
+
+
 # Valid status values for XLS documents
-VALID_STATUSES = [
-    "Draft", "Final", "Living", "Deprecated", "Stagnant", "Withdrawn"
-]
+VALID_STATUSES = [status.value for status in XLSStatus]
 
 # Valid category values for XLS documents
-VALID_CATEGORIES = ["Amendment", "System", "Ecosystem", "Meta"]
+VALID_CATEGORIES = [category.value for category in XLSCategory]
+
+# Bump whenever extract_xls_metadata output changes so that stale metadata
+# cache entries are discarded.
+PARSER_VERSION = 2
+
+# Default location of the metadata cache, relative to the repository root
+DEFAULT_CACHE_DIR = Path(".cache") / "xls"
+
+# Chunk size used when streaming a README up to the end of its preamble
+PREAMBLE_CHUNK_SIZE = 8192
+
+# Parsed documents whose preambles iter_validation_results checks together
+VALIDATION_BATCH_SIZE = 64
+
+
+# Preamble block and the "key: value" lines inside it
+_PRE_BLOCK_RE = re.compile(r"<pre>(.*?)</pre>", re.DOTALL)
+_PREAMBLE_LINE_RE = re.compile(
+    r"^[ \t]*([A-Za-z][A-Za-z-]*):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# Preamble keys (lowercased) mapped to XLSDocument field names
+_PREAMBLE_FIELDS = {
+    "title": "title",
+    "description": "description",
+    "author": "authors",
+    "authors": "authors",
+    "status": "status",
+    "category": "category",
+    "created": "created",
+    "proposal-from": "proposal_from",
+    "implementation": "implementation",
+    "requires": "requires",
+    "updated": "updated",
+    "withdrawal-reason": "withdrawal_reason",
+}
+
+# Default authors value when the preamble has no author field
+_UNKNOWN_AUTHORS = (("Unknown Author", ""),)
+
+_AUTHOR_EMAIL_RE = re.compile(r"^(.*?)\s*<\s*([^>]+)\s*>$")
+_AUTHOR_GITHUB_RE = re.compile(r"^(.*?)\s*\(@([^)]+)\)$")
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+_FOLDER_NUMBER_RE = re.compile(r"XLS-(\d+)([d]?)")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# One whole requires entry: "XLS-33", "33" or a markdown link "[XLS-33](...)"
+_REQUIRES_ITEM_RE = re.compile(
+    r"\[?\s*(?:XLS-?)?0*(\d+)d?\s*(?:\]\([^)]*\))?", re.IGNORECASE
+)
+
+
+def _intern_choice(enum_cls, value: str):
+    """Return the enum member for a value, or the interned string if invalid.
+
+    Invalid values are kept as-is so that validation can report them.
+    """
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return sys.intern(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class XLSDocument:
-    """Represents an XLS document with metadata."""
+    """Represents an XLS document with metadata.
+
+    Status and category are stored as XLSStatus/XLSCategory members when
+    valid (both compare equal to their string values), and authors as a
+    tuple of tuples, so that documents are compact and share storage.
+    """
 
     number: str
     raw_number: int
     title: str
     description: str
-    authors: List[Tuple[str, str]]  # Tuple of (author_name, author_link)
+    authors: Tuple[Tuple[str, str], ...]  # Tuple of (author_name, author_link)
     folder: str
     filename: str
-    status: str  # draft, final, stagnant, withdrawn, etc.
-    category: str  # amendment, ecosystem, system, etc.
+    status: Union[XLSStatus, str]  # draft, final, stagnant, withdrawn, etc.
+    category: Union[XLSCategory, str]  # amendment, ecosystem, system, etc.
     created: str  # YYYY-MM-DD format
     proposal_from: Optional[str] = None  # Link to proposal discussion
     implementation: Optional[str] = None  # Link to implementation PR
@@ -44,84 +139,172 @@ class XLSDocument:
     updated: Optional[str] = None  # YYYY-MM-DD format
     withdrawal_reason: Optional[str] = None  # Reason for withdrawal
 
-    def to_dict(self):
-        return asdict(self)
+    def __post_init__(self):
+        self.authors = tuple(tuple(author) for author in self.authors)
+        self.status = _intern_choice(XLSStatus, self.status)
+        self.category = _intern_choice(XLSCategory, self.category)
+
+    def to_dict(self) -> dict:
+        """Return the document as a plain dict of JSON-compatible values."""
+        return {
+            "number": self.number,
+            "raw_number": self.raw_number,
+            "title": self.title,
+            "description": self.description,
+            "authors": list(self.authors),
+            "folder": self.folder,
+            "filename": self.filename,
+            "status": str(self.status),
+            "category": str(self.category),
+            "created": self.created,
+            "proposal_from": self.proposal_from,
+            "implementation": self.implementation,
+            "requires": self.requires,
+            "updated": self.updated,
+            "withdrawal_reason": self.withdrawal_reason,
+        }
+
+    def to_json(self) -> str:
+        """Serialize the document to a compact JSON string."""
+        return _JSON_ENCODER.encode(self.to_dict())
+
+
+def _format_author(author: str) -> Tuple[str, str]:
+    """Format author information into name and link tuple."""
+    author = author.strip()
+    # Email address
+    email_match = _AUTHOR_EMAIL_RE.match(author)
+    if email_match:
+        name = email_match.group(1).strip()
+        email = email_match.group(2).strip()
+        return name, f'mailto:{email}'
+    # GitHub username in parentheses
+    gh_match = _AUTHOR_GITHUB_RE.match(author)
+    if gh_match:
+        name = gh_match.group(1).strip()
+        gh_user = gh_match.group(2).strip()
+        return name, f'https://github.com/{gh_user}'
+    # Just a name
+    return author, ""
+
+
+def _strip_html(value: str) -> str:
+    """Strip HTML tags and entities from a preamble value.
+
+    Plain values are returned untouched; BeautifulSoup is only constructed
+    when the value could actually contain markup.
+    """
+    if "<" not in value and "&" not in value:
+        return value
+    return BeautifulSoup(value, "html.parser").get_text().strip()
+
+
+def _tokenize_preamble(pre_text: str, fields: Optional[frozenset] = None) -> dict:
+    """Split the preamble into XLSDocument field values in a single pass.
+
+    Keys are matched case-insensitively and the first occurrence of each
+    field wins. Unknown keys (such as ``xls``) are ignored, as are fields
+    not listed in ``fields`` when it is given.
+    """
+    metadata = {}
+    for match in _PREAMBLE_LINE_RE.finditer(pre_text):
+        key = _PREAMBLE_FIELDS.get(match.group(1).lower())
+        if key is None or key in metadata:
+            continue
+        if fields is not None and key not in fields:
+            continue
+        value = match.group(2).strip()
+        if key == "authors":
+            # Process comma-separated authors
+            metadata[key] = [_format_author(author) for author in value.split(",")]
+        else:
+            metadata[key] = _strip_html(value)
+    return metadata
+
+
+def _check_fields(fields) -> Optional[frozenset]:
+    """Normalize a ``fields`` argument, rejecting unknown field names."""
+    if fields is None:
+        return None
+    fields = frozenset(fields)
+    unknown = fields - set(_PREAMBLE_FIELDS.values())
+    if unknown:
+        raise ValueError(f"Unknown preamble field(s): {', '.join(sorted(unknown))}")
+    return fields
+
+
+def _read_preamble_bytes(readme_path: Path) -> bytes:
+    """Read a README incrementally, stopping after the closing </pre>.
+
+    Returns the file content up to and including the first </pre> that
+    follows a <pre>, or the whole file if there is no complete block.
+    """
+    buf = b""
+    start = -1
+    with open(readme_path, "rb") as f:
+        while True:
+            chunk = f.read(PREAMBLE_CHUNK_SIZE)
+            if not chunk:
+                return buf
+            # Re-scan a few bytes before the new chunk in case a tag was
+            # split across the boundary.
+            scan_from = max(0, len(buf) - 5)
+            buf += chunk
+            if start < 0:
+                start = buf.find(b"<pre>", scan_from)
+                if start < 0:
+                    continue
+                scan_from = start + 5
+            end = buf.find(b"</pre>", max(scan_from, start + 5))
+            if end >= 0:
+                return buf[: end + 6]
 
 
-def extract_xls_metadata(content: str, folder_name: str) -> Optional[XLSDocument]:
+def read_xls_preamble(readme_path: Path) -> str:
+    """Read the beginning of an XLS README up to the end of its <pre> block.
+
+    The result can be passed to extract_xls_metadata in place of the full
+    document content.
+    """
+    return _read_preamble_bytes(readme_path).decode("utf-8")
+
+
+def read_xls_content(root_dir: Path, doc: XLSDocument) -> str:
+    """Read the full markdown body of a document found under root_dir."""
+    with open(root_dir / doc.folder / doc.filename, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def extract_xls_metadata(
+    content: str, folder_name: str, fields=None
+) -> Optional[XLSDocument]:
     """Extract metadata from XLS markdown content.
 
     Args:
-        content: The raw markdown content of the XLS document
+        content: The raw markdown content of the XLS document (or just its
+            preamble, as returned by read_xls_preamble)
         folder_name: Name of the folder containing the XLS document
+        fields: Optional iterable of XLSDocument field names to extract;
+            other preamble fields are left at their defaults
 
     Returns:
-        XLSDocument instance with extracted metadata, or None if parsing fails
-    """
+        XLSDocument instance with extracted metadata
 
-    # Initialize metadata with defaults
-    metadata = {}
+    Raises:
+        ValueError: If the content has no <pre> preamble block
+    """
 
     # Parse HTML pre block for metadata
-    pre_regex = r"<pre>(.*?)</pre>"
-    match = re.search(pre_regex, content, re.DOTALL)
+    match = _PRE_BLOCK_RE.search(content)
     if match:
         pre_text = match.group(1)
     else:
-        print("ERROR: No <pre> block found in content")
-        sys.exit(1)
-
-    # Extract metadata using standardized patterns (headers are now enforced by CI)
-    patterns = {
-        "title": r"[tT]itle:\s*(.*?)(?:\n|$)",
-        "description": r"[dD]escription:\s*(.*?)(?:\n|$)",
-        "authors": r"[aA]uthors?:\s*(.*?)(?:\n|$)",
-        "status": r"[sS]tatus:\s*(.*?)(?:\n|$)",
-        "category": r"[cC]ategory:\s*(.*?)(?:\n|$)",
-        "created": r"[cC]reated:\s*(.*?)(?:\n|$)",
-        "proposal_from": r"[pP]roposal-from:\s*(.*?)(?:\n|$)",
-        "implementation": r"[iI]mplementation:\s*(.*?)(?:\n|$)",
-        "requires": r"[rR]equires:\s*(.*?)(?:\n|$)",
-        "updated": r"[uU]pdated:\s*(.*?)(?:\n|$)",
-        "withdrawal_reason": r"[wW]ithdrawal-reason:\s*(.*?)(?:\n|$)",
-    }
-
-    def format_author(author):
-        """Format author information into name and link tuple."""
-        author = author.strip()
-        # Email address
-        email_match = re.match(r"^(.*?)\s*<\s*([^>]+)\s*>$", author)
-        if email_match:
-            name = email_match.group(1).strip()
-            email = email_match.group(2).strip()
-            return name, f'mailto:{email}'
-        # GitHub username in parentheses
-        gh_match = re.match(r"^(.*?)\s*\(@([^)]+)\)$", author)
-        if gh_match:
-            name = gh_match.group(1).strip()
-            gh_user = gh_match.group(2).strip()
-            return name, f'https://github.com/{gh_user}'
-        # Just a name
-        return author, ""
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, pre_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            value = match.group(1).strip()
-            # Clean HTML tags from value and process based on field type
-            if key == "authors":
-                # Process comma-separated authors
-                value = [
-                    format_author(author)
-                    for author in value.split(",")
-                ]
-            else:
-                # Clean HTML tags for other fields
-                value = BeautifulSoup(value, "html.parser").get_text().strip()
-            metadata[key] = value
+        raise ValueError("No <pre> block found in content")
+
+    metadata = _tokenize_preamble(pre_text, _check_fields(fields))
 
     # Extract XLS number from folder name
-    xls_match = re.match(r"XLS-(\d+)([d]?)", folder_name)
+    xls_match = _FOLDER_NUMBER_RE.match(folder_name)
     if xls_match:
         number = xls_match.group(1)
         raw_number = int(number)
@@ -134,7 +317,7 @@ def extract_xls_metadata(content: str, folder_name: str) -> Optional[XLSDocument
         raw_number=raw_number,
         title=metadata.get("title", "Unknown Title"),
         description=metadata.get("description", "No description available"),
-        authors=metadata.get("authors", [("Unknown Author", "")]),
+        authors=metadata.get("authors", _UNKNOWN_AUTHORS),
         folder=folder_name,
         filename="README.md",
         status=metadata.get("status", "Unknown"),
@@ -148,164 +331,1287 @@ def extract_xls_metadata(content: str, folder_name: str) -> Optional[XLSDocument
     )
 
 
-def find_xls_documents(root_dir: Path) -> List[XLSDocument]:
+class XLSParseError(Exception):
+    """Raised when one or more XLS documents fail to parse.
+
+    Attributes:
+        failures: List of (folder, message) tuples, one per failed document
+    """
+
+    def __init__(self, failures: List[Tuple[str, str]]):
+        self.failures = failures
+        details = "\n".join(f"  {folder}: {message}" for folder, message in failures)
+        super().__init__(
+            f"Failed to parse {len(failures)} XLS document(s):\n{details}"
+        )
+
+
+class MetadataCache:
+    """On-disk cache of parsed XLS metadata.
+
+    Entries are keyed by folder name and validated by file size and mtime;
+    when those differ the preamble is hashed, so a README whose metadata is
+    unchanged is still a cache hit. The whole cache is discarded when PARSER_VERSION
+    changes.
+    """
+
+    FILENAME = "metadata.json"
+
+    def __init__(self, cache_dir: Path):
+        self.path = cache_dir / self.FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, dict] = {}
+        self._seen: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load cache entries from disk, ignoring unreadable or stale files."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("parser_version") == PARSER_VERSION:
+            self._entries = data.get("entries", {})
+
+    def lookup(self, readme_path: Path, folder_name: str) -> Optional[XLSDocument]:
+        """Return cached metadata if the README's size and mtime are unchanged."""
+        stat = readme_path.stat()
+        entry = self._entries.get(folder_name)
+        if (
+            entry
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            self.hits += 1
+            self._seen[folder_name] = entry
+            return _document_from_dict(entry["doc"])
+        return None
+
+    def known_digest(self, folder_name: str) -> Optional[str]:
+        """Return the content hash of the cached entry for a folder, if any."""
+        entry = self._entries.get(folder_name)
+        return entry["sha256"] if entry else None
+
+    def store(
+        self,
+        folder_name: str,
+        doc: Optional[XLSDocument],
+        size: int,
+        mtime_ns: int,
+        digest: str,
+    ) -> XLSDocument:
+        """Record metadata read by _read_and_parse and return the document.
+
+        A ``doc`` of None means the content hash matched the cached entry,
+        which is then refreshed with the new size and mtime.
+        """
+        if doc is None:
+            self.hits += 1
+            doc = _document_from_dict(self._entries[folder_name]["doc"])
+        else:
+            self.misses += 1
+
+        self._seen[folder_name] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": digest,
+            "doc": doc.to_dict(),
+        }
+        self._dirty = True
+        return doc
+
+    def get_document(self, readme_path: Path, folder_name: str) -> XLSDocument:
+        """Return metadata for a README, parsing it only on a cache miss."""
+        doc = self.lookup(readme_path, folder_name)
+        if doc is not None:
+            return doc
+        return self.store(
+            folder_name,
+            *_read_and_parse(readme_path, folder_name, self.known_digest(folder_name)),
+        )
+
+    def save(self):
+        """Write the entries used in this run back to disk.
+
+        Entries for folders that were not looked up (e.g. removed specs)
+        are dropped.
+        """
+        if not self._dirty and self._seen.keys() == self._entries.keys():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"parser_version": PARSER_VERSION, "entries": self._seen}, f
+            )
+        os.replace(tmp_path, self.path)
+
+
+def _document_from_dict(data: dict) -> XLSDocument:
+    """Rebuild an XLSDocument from its to_dict() form."""
+    return XLSDocument(**data)
+
+
+def _read_and_parse(
+    readme_path: Path, folder_name: str, known_digest: Optional[str] = None
+) -> Tuple[Optional[XLSDocument], int, int, str]:
+    """Read a README and parse its metadata.
+
+    Args:
+        readme_path: Path to the README.md file
+        folder_name: Name of the folder containing the README
+        known_digest: Cached content hash; parsing is skipped if it matches
+
+    Returns:
+        Tuple of (document, size, mtime_ns, sha256). The hash covers only
+        the preamble, since the metadata does not depend on the rest of the
+        file. The document is None when the hash equals ``known_digest``.
+    """
+    stat = readme_path.stat()
+    raw = _read_preamble_bytes(readme_path)
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if digest == known_digest:
+        return None, stat.st_size, stat.st_mtime_ns, digest
+
+    doc = extract_xls_metadata(raw.decode("utf-8"), folder_name)
+    if not doc:
+        raise Exception(f"Failed to parse metadata from {folder_name}")
+    return doc, stat.st_size, stat.st_mtime_ns, digest
+
+
+def _parse_worker(
+    readme_path: Path, folder_name: str, known_digest: Optional[str]
+) -> Tuple[Optional[tuple], Optional[str]]:
+    """Process pool entry point: returns (result, error) for one folder."""
+    try:
+        return _read_and_parse(readme_path, folder_name, known_digest), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _iter_parsed(
+    readmes: List[Tuple[Path, str]],
+    cache: Optional[MetadataCache],
+    workers: Optional[int] = 1,
+) -> Iterator[Tuple[str, Optional[XLSDocument], Optional[Exception]]]:
+    """Parse READMEs, yielding (folder, document, error) in the given order.
+
+    Exactly one of document and error is set for each folder; failures do
+    not stop the iteration. With more than one worker, cache misses are
+    parsed on a process pool.
+    """
+    if workers is not None and workers <= 1:
+        for readme_path, folder_name in readmes:
+            try:
+                if cache:
+                    doc = cache.get_document(readme_path, folder_name)
+                else:
+                    doc = extract_xls_metadata(
+                        read_xls_preamble(readme_path), folder_name
+                    )
+            except Exception as e:
+                yield folder_name, None, e
+            else:
+                yield folder_name, doc, None
+        return
+
+    cached: Dict[str, XLSDocument] = {}
+    pending = []
+    for readme_path, folder_name in readmes:
+        if cache:
+            doc = cache.lookup(readme_path, folder_name)
+            if doc is not None:
+                cached[folder_name] = doc
+                continue
+        pending.append((readme_path, folder_name))
+
+    if not pending:
+        for _, folder_name in readmes:
+            yield folder_name, cached[folder_name], None
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            folder_name: executor.submit(
+                _parse_worker,
+                readme_path,
+                folder_name,
+                cache.known_digest(folder_name) if cache else None,
+            )
+            for readme_path, folder_name in pending
+        }
+        # Results are consumed in folder order to keep output stable
+        for _, folder_name in readmes:
+            if folder_name in cached:
+                yield folder_name, cached[folder_name], None
+                continue
+            result, error = futures[folder_name].result()
+            if error is not None:
+                yield folder_name, None, Exception(error)
+            elif cache:
+                yield folder_name, cache.store(folder_name, *result), None
+            else:
+                yield folder_name, result[0], None
+
+
+def _list_xls_readmes(root_dir: Path) -> List[Tuple[Path, str]]:
+    """Return (readme_path, folder_name) for every XLS folder, sorted by name."""
+    xls_folders = sorted(
+        (d for d in root_dir.iterdir() if d.is_dir() and d.name.startswith("XLS-")),
+        key=lambda d: d.name,
+    )
+    return [
+        (folder / "README.md", folder.name)
+        for folder in xls_folders
+        if (folder / "README.md").exists()
+    ]
+
+
+def iter_xls_documents(root_dir: Path, fields=None) -> Iterator[XLSDocument]:
+    """Lazily parse XLS documents, reading each README only up to </pre>.
+
+    Documents are yielded in folder-name order as soon as each one is
+    parsed. Use read_xls_content to load a document's full body when it is
+    actually needed.
+
+    Args:
+        root_dir: Root directory to search for XLS folders
+        fields: Optional iterable of XLSDocument field names to extract;
+            other preamble fields are left at their defaults
+
+    Yields:
+        XLSDocument instances
+
+    Raises:
+        Exception: If parsing fails for any document
+    """
+    fields = _check_fields(fields)
+    for readme_path, folder_name in _list_xls_readmes(root_dir):
+        try:
+            doc = extract_xls_metadata(
+                read_xls_preamble(readme_path), folder_name, fields
+            )
+            if not doc:
+                raise Exception(f"Failed to parse metadata from {folder_name}")
+        except Exception as e:
+            print(f"Error processing {folder_name}: {e}")
+            raise
+        yield doc
+
+
+def find_xls_documents(
+    root_dir: Path,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = 1,
+) -> List[XLSDocument]:
     """Find and parse all XLS documents in the given directory.
 
     Args:
         root_dir: Root directory to search for XLS folders
+        use_cache: Whether to reuse metadata from the on-disk cache
+        cache_dir: Cache location (defaults to root_dir / DEFAULT_CACHE_DIR)
+        workers: Number of worker processes. 1 parses serially and stops at
+            the first failure; None uses one worker per CPU. Parallel runs
+            report every failing folder in a single XLSParseError.
 
     Returns:
-        List of XLSDocument instances for all found documents
+        List of XLSDocument instances for all found documents, in folder
+        name order
 
     Raises:
         Exception: If parsing fails for any document
     """
+    readmes = _list_xls_readmes(root_dir)
+    serial = workers is not None and workers <= 1
+
+    cache = None
+    if use_cache:
+        cache = MetadataCache(cache_dir or root_dir / DEFAULT_CACHE_DIR)
+
     xls_docs = []
-    xls_folders = [
-        d for d in root_dir.iterdir() if d.is_dir() and d.name.startswith("XLS-")
-    ]
+    failures: List[Tuple[str, str]] = []
+    for folder_name, doc, error in _iter_parsed(readmes, cache, workers):
+        if error is not None:
+            print(f"Error processing {folder_name}: {error}")
+            if serial:
+                raise error
+            failures.append((folder_name, str(error)))
+            continue
+        xls_docs.append(doc)
+        print(f"Parsed: {folder_name} - {doc.title}")
 
-    for folder in xls_folders:
-        readme_path = folder / "README.md"
-        if readme_path.exists():
-            try:
-                with open(readme_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+    if cache:
+        _save_cache(cache)
+        print(f"Metadata cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+
+    if failures:
+        raise XLSParseError(failures)
+
+    return xls_docs
+
+
+def _save_cache(cache: MetadataCache):
+    """Persist the metadata cache, warning instead of failing on I/O errors."""
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"Warning: could not write metadata cache: {e}", file=sys.stderr)
+
+
+def parse_requires(requires: Optional[str]) -> List[int]:
+    """Parse a free-text ``requires`` value into XLS numbers.
+
+    Accepts comma-separated entries such as ``XLS-33``, ``74`` or markdown
+    links like ``[XLS-70](../XLS-0070-credentials/README.md)``. Entries
+    that are not a single XLS reference (free text) are ignored, so numbers
+    in prose do not become dependencies. Duplicates are dropped and the
+    original order is kept.
+    """
+    if not requires:
+        return []
+    numbers: List[int] = []
+    for item in requires.split(","):
+        match = _REQUIRES_ITEM_RE.fullmatch(item.strip())
+        if match:
+            number = int(match.group(1))
+            if number not in numbers:
+                numbers.append(number)
+    return numbers
+
+
+def _author_handle(link: str) -> Optional[str]:
+    """Return the lowercased GitHub handle or email address from an author link."""
+    if link.startswith("https://github.com/"):
+        return link[len("https://github.com/"):].lower()
+    if link.startswith("mailto:"):
+        return link[len("mailto:"):].lower()
+    return None
+
+
+class XLSDependencyGraph:
+    """Graph of ``requires`` relationships between XLS numbers.
+
+    Edges point from a document to the XLS numbers it requires. Transitive
+    closures are memoized and the memo is cleared whenever an edge changes.
+    """
+
+    def __init__(self, requires: Optional[Dict[int, List[int]]] = None):
+        self._requires: Dict[int, Tuple[int, ...]] = {}
+        self._required_by: Dict[int, set] = {}
+        self._closure_memo: Dict[int, frozenset] = {}
+        self._reverse_memo: Dict[int, frozenset] = {}
+        for number, required in (requires or {}).items():
+            self.set_requires(number, required)
+
+    @classmethod
+    def from_documents(cls, docs) -> "XLSDependencyGraph":
+        """Build a graph from an iterable of XLSDocuments."""
+        return cls({doc.raw_number: parse_requires(doc.requires) for doc in docs})
 
-                doc = extract_xls_metadata(content, folder.name)
-                if doc:
-                    xls_docs.append(doc)
-                    print(f"Parsed: {folder.name} - {doc.title}")
+    def set_requires(self, number: int, required: List[int]):
+        """Set (or replace) the direct requirements of an XLS number."""
+        self.remove(number)
+        self._requires[number] = tuple(required)
+        for dependency in required:
+            self._required_by.setdefault(dependency, set()).add(number)
+        self._closure_memo.clear()
+        self._reverse_memo.clear()
+
+    def remove(self, number: int):
+        """Remove an XLS number and its outgoing edges from the graph."""
+        for dependency in self._requires.pop(number, ()):
+            dependents = self._required_by[dependency]
+            dependents.discard(number)
+            if not dependents:
+                del self._required_by[dependency]
+        self._closure_memo.clear()
+        self._reverse_memo.clear()
+
+    def __contains__(self, number: int) -> bool:
+        return number in self._requires
+
+    def nodes(self) -> List[int]:
+        """Return all XLS numbers in the graph, sorted."""
+        return sorted(self._requires)
+
+    def dependencies(self, number: int) -> List[int]:
+        """Return the XLS numbers directly required by ``number``."""
+        return list(self._requires.get(number, ()))
+
+    def dependents(self, number: int) -> List[int]:
+        """Return the XLS numbers that directly require ``number``."""
+        return sorted(self._required_by.get(number, ()))
+
+    def _reachable(self, number: int, edges, memo: Dict[int, frozenset]) -> frozenset:
+        """Return every node reachable from ``number`` (excluding itself
+        unless it is part of a cycle)."""
+        if number in memo:
+            return memo[number]
+        seen = set()
+        stack = list(edges(number))
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if node in memo:
+                seen |= memo[node]
+            else:
+                stack.extend(edges(node))
+        result = frozenset(seen)
+        memo[number] = result
+        return result
+
+    def all_dependencies(self, number: int) -> List[int]:
+        """Return every XLS number ``number`` transitively requires."""
+        return sorted(
+            self._reachable(
+                number, lambda n: self._requires.get(n, ()), self._closure_memo
+            )
+        )
+
+    def all_dependents(self, number: int) -> List[int]:
+        """Return every XLS number impacted by a change to ``number``."""
+        return sorted(
+            self._reachable(
+                number, lambda n: self._required_by.get(n, ()), self._reverse_memo
+            )
+        )
+
+    def unknown_requirements(self) -> Dict[int, List[int]]:
+        """Return requirements that point at XLS numbers not in the graph."""
+        unknown = {}
+        for number, required in self._requires.items():
+            missing = [n for n in required if n not in self._requires]
+            if missing:
+                unknown[number] = missing
+        return unknown
+
+    def find_cycles(self) -> List[List[int]]:
+        """Return each dependency cycle as a sorted list of XLS numbers.
+
+        Uses an iterative Tarjan strongly-connected-components pass, so the
+        cost is linear in the number of nodes and edges.
+        """
+        index_of: Dict[int, int] = {}
+        lowlink: Dict[int, int] = {}
+        on_stack = set()
+        stack: List[int] = []
+        cycles: List[List[int]] = []
+        counter = 0
+
+        for root in sorted(self._requires):
+            if root in index_of:
+                continue
+            work = [(root, iter(self._requires.get(root, ())))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._requires.get(child, ()))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
                 else:
-                    raise Exception(f"Failed to parse metadata from {folder.name}")
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in self._requires.get(node, ()):
+                            cycles.append(sorted(component))
+        return sorted(cycles)
 
-            except Exception as e:
-                print(f"Error processing {folder.name}: {e}")
-                raise
+    def cycle_path(self, cycle: List[int]) -> List[int]:
+        """Return a closed path of requires edges through a cycle.
 
-    return xls_docs
+        Args:
+            cycle: Members of one cycle, as returned by find_cycles
 
+        Returns:
+            The shortest path from the lowest member back to itself, where
+            each number requires the next, e.g. [3, 9, 5, 3]
+        """
+        members = set(cycle)
+        start = min(cycle)
+        previous: Dict[int, int] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for child in self._requires.get(node, ()):
+                if child == start:
+                    path = [start]
+                    while node != start:
+                        path.append(node)
+                        node = previous[node]
+                    path.append(start)
+                    return path[::-1]
+                if child in members and child not in previous:
+                    previous[child] = node
+                    queue.append(child)
+        return [start, start]
+
+    def topological_order(self) -> List[int]:
+        """Return XLS numbers ordered so that requirements come first.
+
+        Ties are broken by ascending XLS number. Requirements on numbers
+        outside the graph are ignored.
+
+        Raises:
+            ValueError: If the graph contains a dependency cycle
+        """
+        pending = {
+            number: sum(1 for n in set(required) if n in self._requires)
+            for number, required in self._requires.items()
+        }
+        ready = [number for number, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            number = heapq.heappop(ready)
+            order.append(number)
+            for dependent in self._required_by.get(number, ()):
+                if dependent in pending:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        heapq.heappush(ready, dependent)
+        if len(order) != len(pending):
+            raise ValueError(
+                f"Dependency cycle(s) found: {self.find_cycles()}"
+            )
+        return order
+
+
+class XLSCorpus:
+    """Indexed collection of XLS documents.
+
+    Hash indexes are built once so that lookups by number, folder, status,
+    category, author handle and ``requires`` edges do not scan the corpus.
+    Documents are kept in folder-name order.
+    """
+
+    def __init__(self, root_dir: Path, docs: List[XLSDocument]):
+        self.root_dir = root_dir
+        self._docs: Dict[str, XLSDocument] = {}
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        self._by_number: Dict[str, List[XLSDocument]] = {}
+        self._by_raw_number: Dict[int, List[XLSDocument]] = {}
+        self._by_status: Dict[str, List[XLSDocument]] = {}
+        self._by_category: Dict[str, List[XLSDocument]] = {}
+        self._by_author: Dict[str, List[XLSDocument]] = {}
+        self._requires: Dict[str, List[int]] = {}
+        self._required_by: Dict[int, List[XLSDocument]] = {}
+        self._ordered: Optional[List[XLSDocument]] = None
+        self._graph: Optional[XLSDependencyGraph] = None
+
+        for doc in docs:
+            self._signatures[doc.folder] = self._signature(doc.folder)
+            self._add(doc)
+
+    @classmethod
+    def load(
+        cls, root_dir: Path, use_cache: bool = True, workers: Optional[int] = 1
+    ) -> "XLSCorpus":
+        """Parse all XLS documents under root_dir and index them."""
+        return cls(
+            root_dir,
+            find_xls_documents(root_dir, use_cache=use_cache, workers=workers),
+        )
+
+    def _signature(self, folder_name: str) -> Optional[Tuple[int, int]]:
+        """Return (size, mtime_ns) of a folder's README, or None if missing."""
+        try:
+            stat = (self.root_dir / folder_name / "README.md").stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _insert(index: dict, key, doc: XLSDocument):
+        insort(index.setdefault(key, []), doc, key=lambda d: d.folder)
+
+    @staticmethod
+    def _discard(index: dict, key, doc: XLSDocument):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.remove(doc)
+        if not bucket:
+            del index[key]
+
+    def _index_keys(self, doc: XLSDocument):
+        """Yield (index, key) pairs under which a document is stored."""
+        yield self._by_number, doc.number
+        yield self._by_raw_number, doc.raw_number
+        yield self._by_status, doc.status
+        yield self._by_category, doc.category
+        handles = {_author_handle(link) for _, link in doc.authors}
+        handles.discard(None)
+        for handle in handles:
+            yield self._by_author, handle
+        for number in self._requires[doc.folder]:
+            yield self._required_by, number
+
+    def _add(self, doc: XLSDocument):
+        self._docs[doc.folder] = doc
+        self._requires[doc.folder] = parse_requires(doc.requires)
+        for index, key in self._index_keys(doc):
+            self._insert(index, key, doc)
+        self._ordered = None
+        if self._graph is not None:
+            self._graph.set_requires(doc.raw_number, self._requires[doc.folder])
+
+    def _remove(self, folder_name: str):
+        doc = self._docs[folder_name]
+        for index, key in self._index_keys(doc):
+            self._discard(index, key, doc)
+        del self._docs[folder_name]
+        del self._requires[folder_name]
+        self._ordered = None
+        if self._graph is not None:
+            self._graph.remove(doc.raw_number)
+
+    def refresh(self) -> List[str]:
+        """Re-parse only the folders whose README was added, changed or removed.
+
+        Returns:
+            Sorted list of affected folder names
+        """
+        current = {
+            folder_name: self._signature(folder_name)
+            for _, folder_name in _list_xls_readmes(self.root_dir)
+        }
+        changed = sorted(
+            folder_name
+            for folder_name in current.keys() | self._docs.keys()
+            if current.get(folder_name) != self._signatures.get(folder_name)
+        )
+        for folder_name in changed:
+            if folder_name in self._docs:
+                self._remove(folder_name)
+                del self._signatures[folder_name]
+            if folder_name in current:
+                readme_path = self.root_dir / folder_name / "README.md"
+                doc = extract_xls_metadata(read_xls_preamble(readme_path), folder_name)
+                if not doc:
+                    raise Exception(f"Failed to parse metadata from {folder_name}")
+                self._signatures[folder_name] = current[folder_name]
+                self._add(doc)
+        return changed
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __iter__(self) -> Iterator[XLSDocument]:
+        return iter(self.documents())
+
+    def __contains__(self, folder_name: str) -> bool:
+        return folder_name in self._docs
+
+    def documents(self) -> List[XLSDocument]:
+        """Return all documents in folder-name order."""
+        if self._ordered is None:
+            self._ordered = [self._docs[name] for name in sorted(self._docs)]
+        return list(self._ordered)
+
+    def by_folder(self, folder_name: str) -> Optional[XLSDocument]:
+        """Return the document in the given folder, if any."""
+        return self._docs.get(folder_name)
+
+    def by_number(self, number) -> Optional[XLSDocument]:
+        """Return the document with the given XLS number.
+
+        Accepts the integer number (``33``) or a string with or without
+        the zero padding used in folder names (``"33"``, ``"0033"``). If the
+        number is duplicated, the first document in folder order is
+        returned.
+        """
+        if isinstance(number, str):
+            try:
+                number = int(number)
+            except ValueError:
+                return None
+        docs = self._by_raw_number.get(number)
+        return docs[0] if docs else None
+
+    def with_status(self, status: str) -> List[XLSDocument]:
+        """Return documents with the given status."""
+        return list(self._by_status.get(status, []))
+
+    def in_category(self, category: str) -> List[XLSDocument]:
+        """Return documents in the given category."""
+        return list(self._by_category.get(category, []))
+
+    def by_author(self, handle: str) -> List[XLSDocument]:
+        """Return documents by a GitHub handle or email address."""
+        return list(self._by_author.get(handle.lstrip("@").lower(), []))
+
+    def requirements(self, folder_name: str) -> List[int]:
+        """Return the XLS numbers a document lists in ``requires``."""
+        return list(self._requires.get(folder_name, []))
+
+    def required_by(self, number: int) -> List[XLSDocument]:
+        """Return documents that list the given XLS number in ``requires``."""
+        return list(self._required_by.get(number, []))
+
+    def dependency_graph(self) -> XLSDependencyGraph:
+        """Return the requires graph, kept in sync by refresh()."""
+        if self._graph is None:
+            self._graph = XLSDependencyGraph(
+                {
+                    doc.raw_number: self._requires[doc.folder]
+                    for doc in self._docs.values()
+                }
+            )
+        return self._graph
+
+    def statuses(self) -> Dict[str, int]:
+        """Return the number of documents per status."""
+        return {status: len(docs) for status, docs in self._by_status.items()}
+
+    def categories(self) -> Dict[str, List[XLSDocument]]:
+        """Return documents grouped by category."""
+        return {category: list(docs) for category, docs in self._by_category.items()}
+
+    def duplicate_numbers(self) -> Dict[str, List[str]]:
+        """Return folder names for every XLS number used more than once."""
+        return {
+            number: [doc.folder for doc in docs]
+            for number, docs in self._by_number.items()
+            if len(docs) > 1
+        }
 
-def validate_xls_preamble(doc: XLSDocument) -> List[str]:
-    """Validate preamble metadata fields for a single XLS document.
+
+@dataclass(slots=True)
+class ValidationIssue:
+    """A single validation failure for an XLS document.
+
+    Attributes:
+        folder: Folder of the affected document
+        field: Preamble field the issue relates to, if any
+        code: Stable machine-readable identifier (e.g. "missing-field")
+        message: Human-readable description
+    """
+
+    folder: str
+    field: Optional[str]
+    code: str
+    message: str
+
+    def __str__(self):
+        return f"{self.folder}: {self.message}"
+
+    def to_dict(self) -> dict:
+        return {
+            "folder": self.folder,
+            "field": self.field,
+            "code": self.code,
+            "message": self.message,
+        }
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Validation outcome for one folder.
+
+    Attributes:
+        folder: Folder that was validated
+        issues: Every problem found (empty if the folder is valid)
+        scope: "document" for per-document checks, or "corpus" for checks
+            that span documents (duplicate numbers, requires references)
+    """
+
+    folder: str
+    issues: List[ValidationIssue]
+    scope: str = "document"
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> dict:
+        return {
+            "folder": self.folder,
+            "scope": self.scope,
+            "ok": self.ok,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+
+    def to_json(self) -> str:
+        return _JSON_ENCODER.encode(self.to_dict())
+
+
+_VALID_STATUS_SET = frozenset(VALID_STATUSES)
+_VALID_CATEGORY_SET = frozenset(VALID_CATEGORIES)
+_CATEGORY_CHOICES = ", ".join(VALID_CATEGORIES)
+_STATUS_CHOICES = ", ".join(VALID_STATUSES)
+
+
+def _parse_date(value: str) -> Optional[date]:
+    """Return the date for a YYYY-MM-DD string, or None if it is not one."""
+    if not _DATE_RE.match(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _check_date(issue, value: str, field: str) -> Optional[date]:
+    """Report an invalid date field and return the parsed date, if valid."""
+    if not _DATE_RE.match(value):
+        issue(
+            field,
+            "invalid-date",
+            f"Invalid date format for '{field}': {value}. Expected YYYY-MM-DD",
+        )
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        issue(
+            field,
+            "invalid-date",
+            f"Invalid date for '{field}': {value}. Not a real calendar date",
+        )
+        return None
+
+
+def check_xls_preamble(doc: XLSDocument) -> List[ValidationIssue]:
+    """Validate preamble metadata fields, returning structured issues.
 
     Args:
         doc: The XLSDocument to validate
 
     Returns:
-        List of error messages (empty if validation passes)
+        List of ValidationIssue instances (empty if validation passes)
     """
-    errors = []
+    issues = []
+
+    def issue(field, code, message):
+        issues.append(ValidationIssue(doc.folder, field, code, message))
 
     # Required fields
     if not doc.title or doc.title == "Unknown Title":
-        errors.append(f"{doc.folder}: Missing required field: title")
+        issue("title", "missing-field", "Missing required field: title")
 
     if not doc.description or doc.description == "No description available":
-        errors.append(f"{doc.folder}: Missing required field: description")
+        issue("description", "missing-field", "Missing required field: description")
 
-    if not doc.authors or doc.authors == [("Unknown Author", "")]:
-        errors.append(f"{doc.folder}: Missing required field: author")
+    if not doc.authors or doc.authors == _UNKNOWN_AUTHORS:
+        issue("author", "missing-field", "Missing required field: author")
     elif any(not name for name, _ in doc.authors):
-        errors.append(f"{doc.folder}: Author with missing name")
+        issue("author", "missing-author-name", "Author with missing name")
     elif any(link == "" for _, link in doc.authors):
-        errors.append(f"{doc.folder}: Author with missing link")
+        issue("author", "missing-author-link", "Author with missing link")
 
     # Category validation
     if not doc.category or doc.category == "Unknown":
-        errors.append(f"{doc.folder}: Missing required field: category")
-    elif doc.category not in VALID_CATEGORIES:
-        errors.append(
-            f"{doc.folder}: Invalid category '{doc.category}'. "
-            f"Must be one of: {', '.join(VALID_CATEGORIES)}"
+        issue("category", "missing-field", "Missing required field: category")
+    elif doc.category not in _VALID_CATEGORY_SET:
+        issue(
+            "category",
+            "invalid-value",
+            f"Invalid category '{doc.category}'. Must be one of: {_CATEGORY_CHOICES}",
         )
 
     # Status validation
     if not doc.status or doc.status == "Unknown":
-        errors.append(f"{doc.folder}: Missing required field: status")
-    elif doc.status not in VALID_STATUSES:
-        errors.append(
-            f"{doc.folder}: Invalid status '{doc.status}'. "
-            f"Must be one of: {', '.join(VALID_STATUSES)}"
+        issue("status", "missing-field", "Missing required field: status")
+    elif doc.status not in _VALID_STATUS_SET:
+        issue(
+            "status",
+            "invalid-value",
+            f"Invalid status '{doc.status}'. Must be one of: {_STATUS_CHOICES}",
         )
 
     # Created date validation
+    created = None
     if not doc.created or doc.created == "Unknown":
-        errors.append(f"{doc.folder}: Missing required field: created")
-    elif not re.match(r'^\d{4}-\d{2}-\d{2}$', doc.created):
-        errors.append(
-            f"{doc.folder}: Invalid date format for 'created': {doc.created}. "
-            "Expected YYYY-MM-DD"
-        )
+        issue("created", "missing-field", "Missing required field: created")
+    else:
+        created = _check_date(issue, doc.created, "created")
 
     # proposal-from is required
     if not doc.proposal_from:
-        errors.append(f"{doc.folder}: Missing required field: proposal-from")
+        issue("proposal-from", "missing-field", "Missing required field: proposal-from")
 
     # Conditional fields
     if doc.status == "Withdrawn" and not doc.withdrawal_reason:
-        errors.append(
-            f"{doc.folder}: Withdrawn XLS must have withdrawal-reason field"
+        issue(
+            "withdrawal-reason",
+            "missing-field",
+            "Withdrawn XLS must have withdrawal-reason field",
+        )
+
+    # Validate updated field if present
+    if doc.updated:
+        updated = _check_date(issue, doc.updated, "updated")
+        if created and updated and updated < created:
+            issue(
+                "updated",
+                "invalid-date",
+                f"'updated' date {updated} is before 'created' date {created}",
+            )
+
+    return issues
+
+
+def _all_dates(values) -> bool:
+    """Return True if every value is a real YYYY-MM-DD date."""
+    if None in values or not all(map(_DATE_RE.match, values)):
+        return False
+    try:
+        deque(map(date.fromisoformat, values), maxlen=0)
+    except ValueError:
+        return False
+    return True
+
+
+def _suspect_preamble_rows(docs: List[XLSDocument]) -> set:
+    """Return the rows that may have preamble issues; all others are valid.
+
+    Each field is screened for the whole batch with C-level operations
+    (set inclusion, list membership, map over the compiled date pattern).
+    Rows are only examined one by one for a field whose screen failed.
+    """
+    suspects = set()
+
+    def column(field):
+        return list(map(attrgetter(field), docs))
+
+    def screen(values, column_ok, row_bad) -> bool:
+        if column_ok(values):
+            return True
+        suspects.update(row for row, value in enumerate(values) if row_bad(value))
+        return False
+
+    screen(
+        column("title"),
+        lambda values: not ({None, "", "Unknown Title"} & set(values)),
+        lambda value: not value or value == "Unknown Title",
+    )
+    screen(
+        column("description"),
+        lambda values: not ({None, "", "No description available"} & set(values)),
+        lambda value: not value or value == "No description available",
+    )
+    screen(
+        column("authors"),
+        lambda values: not ({None, (), _UNKNOWN_AUTHORS} & set(values))
+        and not ({None, ""} & set(chain.from_iterable(chain.from_iterable(values)))),
+        lambda authors: not authors
+        or authors == _UNKNOWN_AUTHORS
+        or any(not name or link == "" for name, link in authors),
+    )
+    categories = column("category")
+    screen(
+        categories,
+        lambda values: set(values) <= _VALID_CATEGORY_SET,
+        lambda value: value not in _VALID_CATEGORY_SET,
+    )
+    statuses = column("status")
+    screen(
+        statuses,
+        lambda values: set(values) <= _VALID_STATUS_SET,
+        lambda value: value not in _VALID_STATUS_SET,
+    )
+    created = column("created")
+    created_ok = screen(
+        created, _all_dates, lambda value: not value or not _parse_date(value)
+    )
+    screen(
+        column("proposal_from"),
+        lambda values: None not in values and "" not in values,
+        lambda value: not value,
+    )
+    if "Withdrawn" in statuses:
+        suspects.update(
+            row
+            for row, (status, reason) in enumerate(
+                zip(statuses, column("withdrawal_reason"))
+            )
+            if status == "Withdrawn" and not reason
+        )
+    # Valid YYYY-MM-DD strings compare in date order, so "updated" is
+    # checked against "created" without parsing either
+    updated = column("updated")
+    if any(updated):
+        dated = list(compress(updated, updated))
+        if not (
+            created_ok
+            and _all_dates(dated)
+            and not any(map(lt, dated, compress(created, updated)))
+        ):
+            suspects.update(
+                row
+                for row, value in enumerate(updated)
+                if value
+                and (
+                    not _parse_date(value)
+                    or not isinstance(created[row], str)
+                    or value < created[row]
+                )
+            )
+
+    return suspects
+
+
+def check_xls_preambles(docs) -> List[List[ValidationIssue]]:
+    """Validate many preambles at once.
+
+    Every field is first screened for the whole batch (see
+    _suspect_preamble_rows); only documents that fail a screen go through
+    check_xls_preamble. In a corpus where nearly every document is valid
+    this is faster than checking each document in turn.
+
+    Args:
+        docs: Iterable of XLSDocuments
+
+    Returns:
+        One list of ValidationIssue per document, in input order. Each list
+        is identical to check_xls_preamble for that document.
+    """
+    docs = list(docs)
+    results: List[List[ValidationIssue]] = [[] for _ in docs]
+    for row in _suspect_preamble_rows(docs):
+        results[row] = check_xls_preamble(docs[row])
+    return results
+
+
+def validate_xls_preambles(docs) -> List[str]:
+    """Validate many preambles at once.
+
+    Returns:
+        Error messages for all documents, in the same order and format as
+        concatenating validate_xls_preamble for each document
+    """
+    return [str(issue) for issues in check_xls_preambles(docs) for issue in issues]
+
+
+def validate_xls_preamble(doc: XLSDocument) -> List[str]:
+    """Validate preamble metadata fields for a single XLS document.
+
+    Args:
+        doc: The XLSDocument to validate
+
+    Returns:
+        List of error messages (empty if validation passes)
+    """
+    return [str(issue) for issue in check_xls_preamble(doc)]
+
+
+def check_xls_corpus(corpus: XLSCorpus) -> List[ValidationIssue]:
+    """Run checks that span documents: duplicate numbers and requires."""
+    issues = []
+
+    for number, folders in corpus.duplicate_numbers().items():
+        for folder in folders:
+            others = ", ".join(f for f in folders if f != folder)
+            issues.append(ValidationIssue(
+                folder, "xls", "duplicate-number",
+                f"Duplicate XLS number {number} (also used by {others})",
+            ))
+
+    graph = corpus.dependency_graph()
+    for number, missing in sorted(graph.unknown_requirements().items()):
+        issues.append(ValidationIssue(
+            corpus.by_number(number).folder, "requires", "unknown-requires",
+            "Requires unknown XLS number(s): "
+            + ", ".join(str(n) for n in missing),
+        ))
+
+    for cycle in graph.find_cycles():
+        path = graph.cycle_path(cycle)
+        message = "Dependency cycle in requires: " + " -> ".join(
+            f"XLS-{n}" for n in path
         )
+        if len(path) - 1 < len(cycle):
+            involved = ", ".join(f"XLS-{n}" for n in cycle)
+            message += f" (cycle involves {involved})"
+        issues.append(ValidationIssue(
+            corpus.by_number(cycle[0]).folder, "requires", "dependency-cycle",
+            message,
+        ))
+
+    return issues
+
+
+def _check_parsed(
+    parsed: List[Tuple[str, Optional[XLSDocument], Optional[Exception]]],
+) -> Iterator[ValidationResult]:
+    """Validate a run of _iter_parsed results, checking their preambles as
+    one batch (see check_xls_preambles)."""
+    checked = iter(check_xls_preambles(doc for _, doc, _ in parsed if doc is not None))
+    for folder_name, doc, error in parsed:
+        if error is not None:
+            issues = [ValidationIssue(folder_name, None, "parse-error", str(error))]
+        else:
+            issues = next(checked)
+        yield ValidationResult(folder_name, issues)
+
 
-    # Validate updated field format if present
-    if doc.updated and not re.match(r'^\d{4}-\d{2}-\d{2}$', doc.updated):
-        errors.append(
-            f"{doc.folder}: Invalid date format for 'updated': {doc.updated}. "
-            "Expected YYYY-MM-DD"
+def iter_validation_results(
+    root_dir: Path, use_cache: bool = True, workers: Optional[int] = 1
+) -> Iterator[ValidationResult]:
+    """Validate every XLS document, yielding results as they finish.
+
+    Parse failures are reported as issues rather than raised, so the whole
+    corpus is always processed. Preambles are checked in batches of
+    VALIDATION_BATCH_SIZE documents. Per-document results are yielded in
+    folder order, followed by one "corpus" scoped result per folder
+    affected by a cross-document check.
+
+    Args:
+        root_dir: Root directory containing XLS folders
+        use_cache: Whether to reuse metadata from the on-disk cache
+        workers: Number of parser processes (None for one per CPU)
+
+    Yields:
+        ValidationResult instances
+    """
+    cache = None
+    if use_cache:
+        cache = MetadataCache(root_dir / DEFAULT_CACHE_DIR)
+
+    docs = []
+    batch = []
+    readmes = _list_xls_readmes(root_dir)
+    for parsed in _iter_parsed(readmes, cache, workers):
+        batch.append(parsed)
+        if parsed[1] is not None:
+            docs.append(parsed[1])
+        if len(batch) == VALIDATION_BATCH_SIZE:
+            yield from _check_parsed(batch)
+            batch = []
+    yield from _check_parsed(batch)
+
+    if cache:
+        _save_cache(cache)
+        # stderr keeps --format jsonl output machine-readable
+        print(
+            f"Metadata cache: {cache.hits} hit(s), {cache.misses} miss(es)",
+            file=sys.stderr,
         )
 
-    return errors
+    corpus_issues: Dict[str, List[ValidationIssue]] = {}
+    for issue in check_xls_corpus(XLSCorpus(root_dir, docs)):
+        corpus_issues.setdefault(issue.folder, []).append(issue)
+    for folder_name in sorted(corpus_issues):
+        yield ValidationResult(folder_name, corpus_issues[folder_name], "corpus")
 
 
-def validate_xls_documents(root_dir: Path) -> bool:
+def write_validation_jsonl(results, stream=None) -> bool:
+    """Write validation results as JSON Lines, flushing after each one.
+
+    Returns:
+        True if every result passed, False otherwise
+    """
+    stream = stream or sys.stdout
+    success = True
+    for result in results:
+        stream.write(result.to_json() + "\n")
+        stream.flush()
+        success = success and result.ok
+    return success
+
+
+def validate_xls_documents(
+    root_dir: Path, use_cache: bool = True, workers: Optional[int] = 1
+) -> bool:
     """Validate that all XLS documents can be parsed correctly.
 
+    Every document is checked, and all errors are reported together.
+
     Args:
         root_dir: Root directory containing XLS folders
+        use_cache: Whether to reuse metadata from the on-disk cache
+        workers: Number of parser processes (None for one per CPU)
 
     Returns:
         True if all documents parse successfully, False otherwise
     """
-    try:
-        docs = find_xls_documents(root_dir)
-
-        # Basic validation checks
-        if not docs:
-            print("Warning: No XLS documents found")
-            return False
-
-        # Check for duplicate numbers
-        numbers = [doc.number for doc in docs]
-        if len(numbers) != len(set(numbers)):
-            duplicates = [num for num in set(numbers) if numbers.count(num) > 1]
-            print(f"Error: Duplicate XLS numbers found: {duplicates}")
-            return False
-
-        # Validate each document's preamble
-        validation_errors = []
-        for doc in docs:
-            validation_errors.extend(validate_xls_preamble(doc))
-
-        if validation_errors:
-            print("\n")
-            for error in validation_errors:
-                print(f"Error: {error}")
-            print(
-                f"\nValidation failed: {len(validation_errors)} error(s) found"
-            )
-            return False
+    document_count = 0
+    validation_errors = []
+    for result in iter_validation_results(root_dir, use_cache, workers):
+        if result.scope == "document":
+            document_count += 1
+        validation_errors.extend(result.issues)
 
-        print(f"\nSuccessfully validated {len(docs)} XLS documents")
-        return True
+    # Basic validation checks
+    if not document_count:
+        print("Warning: No XLS documents found")
+        return False
 
-    except Exception as e:
-        print(f"Validation failed: {e}")
+    if validation_errors:
+        print("\n")
+        for error in validation_errors:
+            print(f"Error: {error}")
+        print(
+            f"\nValidation failed: {len(validation_errors)} error(s) found"
+        )
         return False
 
+    print(f"\nSuccessfully validated {document_count} XLS documents")
+    return True
+
 
 if __name__ == "__main__":
     """Run validation when script is executed directly."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate XLS document preambles")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every document instead of using the metadata cache",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="?",
+        const=None,
+        default=1,
+        metavar="N",
+        help="Parse documents on N processes (one per CPU if N is omitted)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="Output format; jsonl writes one result per line as it completes",
+    )
+    args = parser.parse_args()
+
     root_dir = Path(".")
-    success = validate_xls_documents(root_dir)
+    if args.format == "jsonl":
+        success = write_validation_jsonl(
+            iter_validation_results(
+                root_dir, use_cache=not args.no_cache, workers=args.workers
+            )
+        )
+    else:
+        success = validate_xls_documents(
+            root_dir, use_cache=not args.no_cache, workers=args.workers
+        )
     sys.exit(0 if success else 1)